@@ -92,11 +92,9 @@ class Fuzzer:
             """
             queues_after_filter = ["plugins_queue", "recursive_queue", "routing_queue"]
             for queue in queues_after_filter:
-                try:
+                # Inactive queues are not part of the manager and can be skipped
+                if queue in self.qmanager:
                     self.qmanager.move_to_end(queue)
-                # KeyError will be raised if it tries to push a queue that is inactive. Can be ignored
-                except KeyError:
-                    continue
 
         if session.compiled_printer_list:
             self.qmanager.add("printer_queue", FilePrinterQueue(session))
@@ -130,11 +128,11 @@ class Fuzzer:
         return fuzz_item
 
     def stats(self) -> dict:
-        return dict(
-            list(self.qmanager.get_stats().items())
-            + list(self.qmanager["transport_queue"].http_pool.job_stats().items())
-            + list(self.session.compiled_stats.get_runtime_stats().items())
-        )
+        return {
+            **self.qmanager.get_stats(),
+            **self.qmanager["transport_queue"].http_pool.job_stats(),
+            **self.session.compiled_stats.get_runtime_stats(),
+        }
 
     def pause_job(self):
         """
@@ -176,18 +174,15 @@ class QueueManager:
         """
         Execute move_to_end function of OrderedDict
         """
-        try:
-            self._queues.move_to_end(key, last)
-        except KeyError:
-            raise
+        self._queues.move_to_end(key, last)
 
     def get_stats(self):
-        stat_list = []
+        stats = {}
 
-        for queue in list(self._queues.values()):
-            stat_list = stat_list + list(queue.get_stats().items())
+        for queue in self._queues.values():
+            stats.update(queue.get_stats())
 
-        return dict(stat_list)
+        return stats
 
     def bind(self, last_queue: FuzzPriorityQueue):
         """Set all the correct output queues."""
@@ -220,6 +215,9 @@ class QueueManager:
     def __getitem__(self, key):
         return self._queues[key]
 
+    def __contains__(self, key):
+        return key in self._queues
+
     def start(self):
         """
         Starting method called by the core
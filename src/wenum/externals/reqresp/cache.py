@@ -1,7 +1,8 @@
 import copy
 import json
 import os
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from threading import Lock
 from typing import Optional
 
 from wenum.externals.reqresp.CachedResponse import CachedResponse
@@ -14,11 +15,18 @@ class HttpCache:
     """
     cache_dir = None
     __cache_dir_map = {}
+    # Maximum amount of entries remembered per memo type
+    MEMO_SIZE = 4096
 
     def __init__(self, cache_dir: Optional[str] = None):
-        # cache control, a dictionary with URLs as keys and their values being lists full of the
+        # cache control, a dictionary with URLs as keys and their values being sets of the
         # categories that the queries were categorized as
-        self.__cache_map = defaultdict(list)
+        self.__cache_map: defaultdict[str, set[str]] = defaultdict(set)
+        # Several queues share the cache, the lock makes checking and updating it a single step
+        self.mutex = Lock()
+        # Results of work that is expensive to repeat, e.g. the requests of the false positive check. Divided by
+        # memo type, each being a bounded LRU of keys and their values
+        self.__memo_map: defaultdict[str, OrderedDict] = defaultdict(OrderedDict)
         if cache_dir:
             self.load_cache_dir(cache_dir)
 
@@ -31,17 +39,43 @@ class HttpCache:
         the new request won't count as cached if it is checked against '/robots.txt, seed'.
 
         if the update bool is True (default), the function will also add the key to the cache if it did not exist yet.
+        Checking and adding happens atomically, so only one of several callers checking the same key will get False.
 
         Returns True if it was in the cache.
         Returns False if it was not in the cache.
         """
-        if url_key in self.__cache_map and cache_type in self.__cache_map[url_key]:
-            cached = True
-        else:
-            cached = False
-        if update:
-            self.__cache_map[url_key].append(cache_type)
-        return cached
+        if not update:
+            cache_types = self.__cache_map.get(url_key)
+            return cache_types is not None and cache_type in cache_types
+        with self.mutex:
+            cache_types = self.__cache_map[url_key]
+            if cache_type in cache_types:
+                return True
+            cache_types.add(cache_type)
+            return False
+
+    def get_memo(self, key, memo_type: str):
+        """
+        Returns the value memoized for the key, or None if it is not memoized (anymore)
+        """
+        with self.mutex:
+            memo = self.__memo_map[memo_type]
+            value = memo.get(key)
+            if value is not None:
+                memo.move_to_end(key)
+            return value
+
+    def set_memo(self, key, value, memo_type: str) -> None:
+        """
+        Memoizes the value for the key. Once MEMO_SIZE is exceeded, the least recently used entry of the memo type is
+        dropped
+        """
+        with self.mutex:
+            memo = self.__memo_map[memo_type]
+            memo[key] = value
+            memo.move_to_end(key)
+            if len(memo) > self.MEMO_SIZE:
+                memo.popitem(last=False)
 
     def get_object_from_object_cache(self, fuzz_result: FuzzResult, key=False) -> Optional[FuzzResult]:
         """
@@ -25,7 +25,6 @@ class PluginBackfeedBuilder:
     def __call__(self, name, originating_fuzzres, url, method) -> FuzzPlugin:
         plugin = FuzzPlugin()
         plugin.name = name
-        plugin.exception = None
         from_plugin = True
         plugin.seed = resfactory.create("fuzzres_from_fuzzres", originating_fuzzres, url, method, from_plugin)
 
@@ -40,7 +39,6 @@ class PluginSeedBuilder:
     def __call__(self, name, seed, seeding_url) -> FuzzPlugin:
         plugin = FuzzPlugin()
         plugin.name = name
-        plugin.exception = None
         plugin.seed = resfactory.create("seed_from_plugin", seed, seeding_url)
 
         return plugin
@@ -53,22 +51,21 @@ class PluginErrorBuilder:
         plugin.message = "Exception within plugin %s: %s" % (name, str(exception))
         plugin.exception = FuzzError(exception)
         plugin.severity = FuzzPlugin.HIGH
-        plugin.seed = None
 
         return plugin
 
 
 class PluginFindingBuilder:
     """
-    Creates a Plugin object dedicated to storing message information linked to the fuzzresult for logging purposes
+    Creates a Plugin object dedicated to storing message information linked to the fuzzresult for logging purposes.
+    If message_args are passed, message is a str.format template that only gets formatted once it is read
     """
-    def __call__(self, name, message, severity) -> FuzzPlugin:
+    def __call__(self, name, message, severity, message_args: tuple = ()) -> FuzzPlugin:
         plugin = FuzzPlugin()
         plugin.name = name
         plugin.message = message
+        plugin._message_args = message_args
         plugin.severity = severity
-        plugin.exception = None
-        plugin.seed = None
 
         return plugin
 
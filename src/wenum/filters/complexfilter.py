@@ -5,23 +5,29 @@ from typing import Optional as TypingOptional
 from wenum.filters.base_filter import BaseFilter
 
 if TYPE_CHECKING:
-    from wenum.facade import Facade, ERROR_CODE
     from wenum.fuzzobjects import FuzzResult
 
+from ..facade import Facade, ERROR_CODE
 from ..exception import FuzzExceptIncorrectFilter, FuzzExceptBadOptions
 from ..helpers.obj_dyn import (
-    rgetattr,
+    rgetattr_accessor,
     rsetattr,
 )
 from ..helpers.str_func import value_in_any_list_item
 from ..helpers.obj_dic import DotDict
 from ..helpers.utils import diff
 
+import os
 import re
-import collections
+import functools
+import hashlib
 import operator
+from contextlib import nullcontext
+from contextvars import ContextVar
+from threading import Lock
 from urllib.parse import unquote
 from pyparsing import (
+    ParserElement,
     Word,
     Group,
     oneOf,
@@ -34,33 +40,294 @@ from pyparsing import (
     Regex,
 )
 
+# Packrat caching slows down the evaluation of typical filter expressions, whose parse actions are cheap compared to
+# the cache bookkeeping. It can be enabled for deeply nested expressions.
+# The packrat cache is global to ParserElement and keyed on the expression, the string and the location, not on the
+# evaluated FuzzResult. As the grammar is shared, two threads evaluating the same filter string (e.g. the filter queue
+# and a plugin) could be served each other's cached parse action values. With packrat enabled, the grammar is
+# therefore only used by one thread at a time.
+if os.environ.get("WENUM_PACKRAT") == "1":
+    ParserElement.enablePackrat(cache_size_limit=128)
+    _grammar_lock = Lock()
+else:
+    _grammar_lock = nullcontext()
+
+# The filter whose expression is currently being evaluated by the shared grammar. Context variables are local to
+# each thread, therefore several queues can evaluate their filters at the same time.
+_current_filter: ContextVar[FuzzResFilter] = ContextVar("_current_filter")
+
+
+def _on_current_filter(method):
+    """
+    Wraps an unbound FuzzResFilter method into a parse action running against the filter currently evaluated.
+    The full (instring, loc, tokens) signature is kept on purpose: pyparsing otherwise guesses the arity on the
+    first call by retrying, and that state is not safe to share between threads evaluating the same grammar.
+    """
+    def parse_action(instring, loc, tokens):
+        return method(_current_filter.get(), tokens)
+
+    return parse_action
+
+
+# Strings longer than this are remembered by the unique operator as a digest rather than as a whole
+_UNIQUE_DIGEST_THRESHOLD = 64
+
+
+def _unique_key(value):
+    """
+    Returns the key the unique operator remembers a value by. Long strings, e.g. response contents, are reduced to
+    a fixed size digest to bound the memory of the cache during long runs.
+    """
+    if isinstance(value, str) and len(value) > _UNIQUE_DIGEST_THRESHOLD:
+        return hashlib.blake2b(value.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+    return value
+
+
+def _single_token(value):
+    """
+    Returns the value of a parse action so that pyparsing keeps it as a single token. Lists returned directly would
+    be flattened into one token per element, therefore only those get wrapped.
+    """
+    if isinstance(value, list):
+        return [value]
+    return value
+
+
+_FUZZ_SYMBOL_PATTERN = r"FUZ(?P<index>\d)*Z(?:\[(?P<field>(\w|_|-|\.)+)\])?"
+_RES_SYMBOL_PATTERN = (
+    r"(description|nres|code|chars|lines|words|md5|content|timer|url|l|w|c|(r|history|plugins)(\w|_|-|\.)*|h)"
+)
+# Matches the symbol an expression starts with in the same order the grammar tries them. The field of a payload
+# is captured by "field", the one of a result by "res_field"
+_LEFT_FIELD_REGEX = re.compile(rf"{_FUZZ_SYMBOL_PATTERN}|(?P<res_field>{_RES_SYMBOL_PATTERN})", re.ASCII)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern, flags=0):
+    """
+    Compiles regexes provided within filter expressions. They are evaluated against every response, and unlike
+    the shared cache of the re module, this one can't be flushed by unrelated code.
+    """
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_encoder(name):
+    """
+    Returns an instance of the encoder plugin used by the encode/decode operators. The name is a constant of the
+    filter expression, so the plugin only needs to be looked up and instantiated once.
+    """
+    return Facade().encoders.get_plugin(name)()
+
+
+# Fields and operators of expressions simple enough to be evaluated without invoking the grammar
+_SIMPLE_FIELDS = {"code": "code", "c": "code", "lines": "lines", "l": "lines", "words": "words", "w": "words",
+                  "chars": "chars", "h": "chars"}
+_SIMPLE_OPERATORS = {"=": operator.eq, "==": operator.eq, "!=": operator.ne, "<=": operator.le, ">=": operator.ge,
+                     "<": operator.lt, ">": operator.gt}
+
+
+def _equal(ffilter, leftvalue, rightvalue, field_to_set):
+    # Operands of the same type compare like their string representations, sparing the conversion
+    if type(leftvalue) is type(rightvalue) and type(leftvalue) in (str, int):
+        return leftvalue == rightvalue
+    return str(leftvalue) == str(rightvalue)
+
+
+def _not_equal(ffilter, leftvalue, rightvalue, field_to_set):
+    return leftvalue != rightvalue
+
+
+def _less_equal(ffilter, leftvalue, rightvalue, field_to_set):
+    if type(leftvalue) is not int:
+        leftvalue = int(leftvalue)
+    if type(rightvalue) is not int:
+        rightvalue = int(rightvalue)
+    return leftvalue <= rightvalue
+
+
+def _greater_equal(ffilter, leftvalue, rightvalue, field_to_set):
+    if type(leftvalue) is not int:
+        leftvalue = int(leftvalue)
+    if type(rightvalue) is not int:
+        rightvalue = int(rightvalue)
+    return leftvalue >= rightvalue
+
+
+def _less(ffilter, leftvalue, rightvalue, field_to_set):
+    if type(leftvalue) is not int:
+        leftvalue = int(leftvalue)
+    if type(rightvalue) is not int:
+        rightvalue = int(rightvalue)
+    return leftvalue < rightvalue
+
+
+def _greater(ffilter, leftvalue, rightvalue, field_to_set):
+    if type(leftvalue) is not int:
+        leftvalue = int(leftvalue)
+    if type(rightvalue) is not int:
+        rightvalue = int(rightvalue)
+    return leftvalue > rightvalue
+
+
+def _regex_search(ffilter, leftvalue, rightvalue, field_to_set):
+    regex = _compile(rightvalue, re.MULTILINE | re.DOTALL)
+    return regex.search(leftvalue) is not None
+
+
+def _contains(ffilter, leftvalue, rightvalue, field_to_set):
+    # Exact type checks first for the common operands, isinstance only for the remaining ones
+    value_type = type(leftvalue)
+    if value_type is str:
+        return rightvalue.lower() in leftvalue.lower()
+    elif value_type is list:
+        return value_in_any_list_item(rightvalue, leftvalue)
+    elif isinstance(leftvalue, (dict, DotDict)):
+        return rightvalue.lower() in str(leftvalue).lower()
+    elif isinstance(leftvalue, str):
+        return rightvalue.lower() in leftvalue.lower()
+    elif isinstance(leftvalue, list):
+        return value_in_any_list_item(rightvalue, leftvalue)
+    else:
+        raise FuzzExceptBadOptions(
+            "Invalid operand type {}".format(rightvalue)
+        )
+
+
+def _not_contains(ffilter, leftvalue, rightvalue, field_to_set):
+    return not _contains(ffilter, leftvalue, rightvalue, field_to_set)
+
+
+def _assign(ffilter, leftvalue, rightvalue, field_to_set):
+    rsetattr(ffilter.fuzz_result, field_to_set, rightvalue, None)
+    return True
+
+
+def _add_assign(ffilter, leftvalue, rightvalue, field_to_set):
+    rsetattr(ffilter.fuzz_result, field_to_set, rightvalue, operator.add)
+    return True
+
+
+def _sub_assign(ffilter, leftvalue, rightvalue, field_to_set):
+    if isinstance(rightvalue, str):
+        rsetattr(ffilter.fuzz_result, field_to_set, rightvalue, lambda x, y: y + x)
+    else:
+        rsetattr(ffilter.fuzz_result, field_to_set, rightvalue, operator.sub)
+    return True
+
+
+# Operators assigning to the field on the left hand side of the expression
+_ASSIGNMENT_OPERATORS = {":=", "=+", "=-"}
+
+# Handlers of the comparison and assignment operators, called with the filter evaluating the expression,
+# both operands and the field to assign to
+_EXPRESSION_OPERATORS = {
+    "=": _equal,
+    "==": _equal,
+    "!=": _not_equal,
+    "<=": _less_equal,
+    ">=": _greater_equal,
+    "<": _less,
+    ">": _greater,
+    "=~": _regex_search,
+    "~": _contains,
+    "!~": _not_contains,
+    ":=": _assign,
+    "=+": _add_assign,
+    "=-": _sub_assign,
+}
+
 
 class FuzzResFilter(BaseFilter):
     """
     Filter class for more complex filtering, often triggered by the --filter argument
     """
-    FUZZ_MARKER_REGEX = re.compile(r"FUZ\d*Z", re.MULTILINE | re.DOTALL)
+    FUZZ_MARKER_REGEX = re.compile(r"FUZ\d*Z", re.MULTILINE | re.DOTALL | re.ASCII)
+    # Matches trivial expressions such as c=200 or w>0, which are evaluated directly in Python
+    SIMPLE_EXPRESSION_REGEX = re.compile(r"^\s*(code|c|lines|l|words|w|chars|h)\s*(==|=|!=|<=|>=|<|>)\s*(\d+)\s*$")
+
+    # Grammar shared by every instance, built lazily once by _build_grammar()
+    _GRAMMAR: TypingOptional[ParserElement] = None
 
     def __init__(self, filter_string=None):
         super().__init__()
+        self.finalformula = self._build_grammar()
         self.filter_string = filter_string
 
+        self.fuzz_result: TypingOptional[FuzzResult] = None
+        # Values seen by the unique operator, per location of the operator within the expression
+        self._cache: dict[int, set] = {}
+
+    @property
+    def filter_string(self):
+        return self._filter_string
+
+    @filter_string.setter
+    def filter_string(self, filter_string):
+        self._filter_string = filter_string
+        self._fast_eval = self._compile_simple_expression(filter_string)
+        self._fuzz_words = self.FUZZ_MARKER_REGEX.findall(filter_string) if filter_string else []
+        if filter_string and self._fast_eval is None:
+            self._check_syntax(filter_string)
+
+    def _check_syntax(self, filter_string):
+        """
+        Matches the filter_string against the grammar without evaluating it, so that a malformed expression is
+        reported once when the filter gets set instead of for every evaluated response
+        """
+        try:
+            with _grammar_lock:
+                end = self.finalformula.try_parse(filter_string, 0)
+        except ParseException as e:
+            raise FuzzExceptIncorrectFilter(
+                f"Incorrect filter expression \"{filter_string}\", check documentation. \n{str(e)}"
+            )
+        if filter_string[end:].strip():
+            raise FuzzExceptIncorrectFilter(
+                f"Incorrect filter expression \"{filter_string}\", check documentation. \n"
+                f"Unexpected input at char {end}: {filter_string[end:]}"
+            )
+
+    @classmethod
+    def _compile_simple_expression(cls, filter_string):
+        """
+        Returns a callable evaluating the filter_string against a fuzz_result if it is a trivial comparison of a
+        numeric field with an integer, e.g. c=200. Returns None if the grammar is required to evaluate it.
+        """
+        match = cls.SIMPLE_EXPRESSION_REGEX.match(filter_string) if filter_string else None
+        if match is None:
+            return None
+
+        field = _SIMPLE_FIELDS[match.group(1)]
+        compare = _SIMPLE_OPERATORS[match.group(2)]
+        value = int(match.group(3))
+
+        return lambda fuzz_result: compare(getattr(fuzz_result, field), value)
+
+    @classmethod
+    def _build_grammar(cls) -> ParserElement:
+        """
+        Returns the pyparsing grammar of the filter language. The grammar itself is stateless, its parse actions
+        are dispatched to the filter currently evaluating an expression. Therefore, it only needs to be built once.
+        """
+        if cls._GRAMMAR is not None:
+            return cls._GRAMMAR
+
         quoted_str_value = QuotedString("'", unquoteResults=True, escChar="\\")
         int_values = Word("0123456789").setParseAction(lambda s, l, t: [int(t[0])])
-        error_value = Literal("XXX").setParseAction(self.__compute_xxx_value)
+        error_value = Literal("XXX").setParseAction(_on_current_filter(cls.__compute_xxx_value))
 
         operator_call = Regex(
             r"\|(?P<operator>(m|d|e|un|u|r|l|sw|gre|gregex|unique|startswith|decode|encode|unquote|replace|lower|upper))"
             r"\((?:(?P<param1>('.*?'|\d+))(?:,(?P<param2>('.*?'|\d+)))?)?\)",
             asMatch=True,
+            flags=re.ASCII,
         ).setParseAction(lambda s, l, t: [(l, t[0])])
 
-        fuzz_symbol = Regex(
-            r"FUZ(?P<index>\d)*Z(?:\[(?P<field>(\w|_|-|\.)+)\])?", asMatch=True
-        ).setParseAction(self._compute_fuzz_symbol)
-        res_symbol = Regex(
-            r"(description|nres|code|chars|lines|words|md5|content|timer|url|l|w|c|(r|history|plugins)(\w|_|-|\.)*|h)"
-        ).setParseAction(self._compute_res_symbol)
+        fuzz_symbol = Regex(_FUZZ_SYMBOL_PATTERN, asMatch=True, flags=re.ASCII).setParseAction(
+            _on_current_filter(cls._compute_fuzz_symbol))
+        res_symbol = Regex(_RES_SYMBOL_PATTERN, flags=re.ASCII).setParseAction(
+            _on_current_filter(cls._compute_res_symbol))
 
         diff_call = Group(
             Suppress(Literal("|"))
@@ -73,7 +340,7 @@ class FuzzResFilter(BaseFilter):
         fuzz_statement = Group(
             (fuzz_symbol | res_symbol | int_values | quoted_str_value)
             + Optional(diff_call | operator_call, None)
-        ).setParseAction(self.__compute_res_value)
+        ).setParseAction(_on_current_filter(cls.__compute_res_value))
 
         operator = oneOf("and or")
         not_operator = Optional(oneOf("not"), "notpresent")
@@ -82,7 +349,7 @@ class FuzzResFilter(BaseFilter):
             fuzz_statement
             + oneOf("= == != < > >= <= =~ !~ ~ := =+ =-")
             + (error_value | fuzz_statement)
-        ).setParseAction(self.__compute_expr)
+        ).setParseAction(lambda s, l, t: cls.__compute_expr(_current_filter.get(), s, l, t))
 
         definition = symbol_expr ^ fuzz_statement
         definition_not = not_operator + definition
@@ -91,25 +358,27 @@ class FuzzResFilter(BaseFilter):
         nested_definition = Group(Suppress("(") + definition_expr + Suppress(")"))
         nested_definition_not = not_operator + nested_definition
 
-        self.finalformula = (nested_definition_not | definition_expr) + ZeroOrMore(
+        finalformula = (nested_definition_not | definition_expr) + ZeroOrMore(
             operator + (nested_definition_not | definition_expr)
         )
 
-        definition_not.setParseAction(self.__compute_not_operator)
-        nested_definition_not.setParseAction(self.__compute_not_operator)
-        nested_definition.setParseAction(self.__compute_formula)
-        self.finalformula.setParseAction(self.__myreduce)
+        definition_not.setParseAction(_on_current_filter(cls.__compute_not_operator))
+        nested_definition_not.setParseAction(_on_current_filter(cls.__compute_not_operator))
+        nested_definition.setParseAction(_on_current_filter(cls.__compute_formula))
+        finalformula.setParseAction(_on_current_filter(cls.__myreduce))
 
-        self.fuzz_result: TypingOptional[FuzzResult] = None
-        self.stack = []
-        self._cache = collections.defaultdict(set)
+        cls._GRAMMAR = finalformula
+        return finalformula
 
     def _compute_res_symbol(self, tokens):
         return self._get_field_value(self.fuzz_result, tokens[0])
 
     def _compute_fuzz_symbol(self, tokens):
-        match_dict = tokens[0].groupdict()
-        p_index = int(match_dict["index"]) if match_dict["index"] is not None else 1
+        match = tokens[0]
+        index = match.group("index")
+        field = match.group("field")
+        # The index group captures a single ASCII digit, which can be converted without int()
+        p_index = ord(index) - 48 if index is not None else 1
 
         try:
             fuzz_val = self.fuzz_result.payload_man.get_payload_content(p_index)
@@ -118,8 +387,8 @@ class FuzzResFilter(BaseFilter):
                 "Non existent FUZZ payload! Use a correct index."
             )
 
-        if match_dict["field"]:
-            fuzz_val = self._get_field_value(fuzz_val, match_dict["field"])
+        if field:
+            fuzz_val = self._get_field_value(fuzz_val, field)
 
         return fuzz_val
 
@@ -132,14 +401,13 @@ class FuzzResFilter(BaseFilter):
             if location == "diff":
                 return diff(operator_match, fuzz_val)
             else:
-                if operator_match and operator_match.groupdict()["operator"]:
-                    fuzz_val = self._get_operator_value(
-                        location, fuzz_val, operator_match.groupdict()
+                # Operators never return lists, so their result needs no wrapping
+                if operator_match and operator_match.group("operator"):
+                    return self._get_operator_value(
+                        location, fuzz_val, operator_match
                     )
 
-        if isinstance(fuzz_val, list):
-            return [fuzz_val]
-        return fuzz_val
+        return _single_token(fuzz_val)
 
     def _get_payload_value(self, p_index):
         try:
@@ -150,10 +418,8 @@ class FuzzResFilter(BaseFilter):
             )
 
     def _get_field_value(self, fuzz_val, field):
-        self.stack.append(field)
-
         try:
-            ret = rgetattr(fuzz_val, field)
+            ret = rgetattr_accessor(field)(fuzz_val)
         except IndexError:
             raise FuzzExceptIncorrectFilter(
                 "Non existent FUZZ payload! Use a correct index."
@@ -165,14 +431,12 @@ class FuzzResFilter(BaseFilter):
                 )
             )
 
-        if isinstance(ret, list):
-            return [ret]
-        return ret
+        return _single_token(ret)
 
-    def _get_operator_value(self, location, fuzz_val, match_dict):
-        op = match_dict["operator"]
-        param1 = match_dict["param1"]
-        param2 = match_dict["param2"]
+    def _get_operator_value(self, location, fuzz_val, operator_match):
+        op = operator_match.group("operator")
+        param1 = operator_match.group("param1")
+        param2 = operator_match.group("param2")
 
         if param1:
             param1 = param1.strip("'")
@@ -182,9 +446,9 @@ class FuzzResFilter(BaseFilter):
         if (op == "un" or op == "unquote") and param1 is None and param2 is None:
             ret = unquote(fuzz_val)
         elif (op == "e" or op == "encode") and param1 is not None and param2 is None:
-            ret = Facade().encoders.get_plugin(param1)().encode(fuzz_val)
+            ret = _get_encoder(param1).encode(fuzz_val)
         elif (op == "d" or op == "decode") and param1 is not None and param2 is None:
-            ret = Facade().encoders.get_plugin(param1)().decode(fuzz_val)
+            ret = _get_encoder(param1).decode(fuzz_val)
         elif op == "r" or op == "replace":
             return fuzz_val.replace(param1, param2)
         elif op == "upper":
@@ -193,7 +457,7 @@ class FuzzResFilter(BaseFilter):
             return fuzz_val.lower()
         elif op == "gregex" or op == "gre":
             try:
-                regex = re.compile(param1)
+                regex = _compile(param1)
                 search_res = regex.search(fuzz_val)
             except re.error as e:
                 raise FuzzExceptBadOptions(
@@ -206,11 +470,14 @@ class FuzzResFilter(BaseFilter):
         elif op == "startswith" or op == "sw":
             return fuzz_val.strip().startswith(param1)
         elif op == "unique" or op == "u":
-            if fuzz_val not in self._cache[location]:
-                self._cache[location].add(fuzz_val)
-                return True
-            else:
+            unique_key = _unique_key(fuzz_val)
+            seen = self._cache.get(location)
+            if seen is None:
+                seen = self._cache[location] = set()
+            if unique_key in seen:
                 return False
+            seen.add(unique_key)
+            return True
         else:
             raise FuzzExceptBadOptions(
                 "Bad format, expression should be m,d,e,r,s(value,value)"
@@ -221,55 +488,18 @@ class FuzzResFilter(BaseFilter):
     def __compute_xxx_value(self, tokens):
         return ERROR_CODE
 
-    def __compute_expr(self, tokens):
+    def __compute_expr(self, string, location, tokens):
         leftvalue, exp_operator, rightvalue = tokens[0]
 
-        # a bit hacky but we don't care about fields on the right hand side of the expression
-        if len(self.stack) > 1:
-            self.stack.pop()
-
-        field_to_set = self.stack.pop() if self.stack else None
+        # Only assignments need the field of the left hand side, which is read from the expression itself
+        field_to_set = None
+        if exp_operator in _ASSIGNMENT_OPERATORS:
+            field_match = _LEFT_FIELD_REGEX.match(string, location)
+            if field_match:
+                field_to_set = field_match.group("field") or field_match.group("res_field")
 
         try:
-            if exp_operator in ["=", "=="]:
-                return str(leftvalue) == str(rightvalue)
-            elif exp_operator == "<=":
-                return int(leftvalue) <= int(rightvalue)
-            elif exp_operator == ">=":
-                return int(leftvalue) >= int(rightvalue)
-            elif exp_operator == "<":
-                return int(leftvalue) < int(rightvalue)
-            elif exp_operator == ">":
-                return int(leftvalue) > int(rightvalue)
-            elif exp_operator == "!=":
-                return leftvalue != rightvalue
-            elif exp_operator == "=~":
-                regex = re.compile(rightvalue, re.MULTILINE | re.DOTALL)
-                return regex.search(leftvalue) is not None
-            elif exp_operator in ["!~", "~"]:
-                ret = True
-
-                if isinstance(leftvalue, str):
-                    ret = rightvalue.lower() in leftvalue.lower()
-                elif isinstance(leftvalue, list):
-                    ret = value_in_any_list_item(rightvalue, leftvalue)
-                elif isinstance(leftvalue, dict) or isinstance(leftvalue, DotDict):
-                    ret = rightvalue.lower() in str(leftvalue).lower()
-                else:
-                    raise FuzzExceptBadOptions(
-                        "Invalid operand type {}".format(rightvalue)
-                    )
-
-                return ret if exp_operator == "~" else not ret
-            elif exp_operator == ":=":
-                rsetattr(self.fuzz_result, field_to_set, rightvalue, None)
-            elif exp_operator == "=+":
-                rsetattr(self.fuzz_result, field_to_set, rightvalue, operator.add)
-            elif exp_operator == "=-":
-                if isinstance(rightvalue, str):
-                    rsetattr(self.fuzz_result, field_to_set, rightvalue, lambda x, y: y + x)
-                else:
-                    rsetattr(self.fuzz_result, field_to_set, rightvalue, operator.sub)
+            return _EXPRESSION_OPERATORS[exp_operator](self, leftvalue, rightvalue, field_to_set)
         except re.error as e:
             raise FuzzExceptBadOptions(
                 "Invalid regex expression used in expression: %s" % str(e)
@@ -281,21 +511,19 @@ class FuzzResFilter(BaseFilter):
         except ParseException as e:
             raise FuzzExceptBadOptions("Invalid filter: %s" % str(e))
 
-        return True
-
     def __myreduce(self, elements):
         first = elements[0]
         for i in range(1, len(elements), 2):
+            # Operands whose value can't change the result so far are skipped. Breaking out of the loop instead
+            # would be wrong for mixed chains, e.g. "False and x or True" folds to True
             if elements[i] == "and":
-                first = first and elements[i + 1]
-            elif elements[i] == "or":
-                first = first or elements[i + 1]
-
-        self.stack = []
+                if first:
+                    first = elements[i + 1]
+            # The grammar only produces "and" and "or" in between operands
+            elif not first:
+                first = elements[i + 1]
 
-        if isinstance(first, list):
-            return [first]
-        return first
+        return _single_token(first)
 
     def __compute_not_operator(self, tokens):
         operator, value = tokens
@@ -303,19 +531,21 @@ class FuzzResFilter(BaseFilter):
         if operator == "not":
             return not value
 
-        if isinstance(value, list):
-            return [value]
-        return value
+        return _single_token(value)
 
     def __compute_formula(self, tokens):
         return self.__myreduce(tokens[0])
 
     def is_filtered(self, fuzz_result, filter_string=None):
         if filter_string is None:
+            if self._fast_eval is not None:
+                return not self._fast_eval(fuzz_result)
             filter_string = self.filter_string
         self.fuzz_result = fuzz_result
+        token = _current_filter.set(self)
         try:
-            return not self.finalformula.parseString(filter_string, parseAll=True)[0]
+            with _grammar_lock:
+                return not self.finalformula.parseString(filter_string, parseAll=True)[0]
         except ParseException as e:
             raise FuzzExceptIncorrectFilter(
                 f"Incorrect filter expression \"{filter_string}\", check documentation. \n{str(e)}"
@@ -325,11 +555,8 @@ class FuzzResFilter(BaseFilter):
                 "It is only possible to use advanced filters when using a non-string payload. %s"
                 % str(e)
             )
+        finally:
+            _current_filter.reset(token)
 
     def get_fuzz_words(self):
-        if self.filter_string:
-            fuzz_words = self.FUZZ_MARKER_REGEX.findall(self.filter_string)
-        else:
-            fuzz_words = []
-
-        return fuzz_words
+        return self._fuzz_words
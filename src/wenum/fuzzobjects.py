@@ -7,7 +7,6 @@ if TYPE_CHECKING:
     from wenum.fuzzrequest import FuzzRequest
 import time
 import hashlib
-import re
 import itertools
 from enum import Enum
 
@@ -355,7 +354,8 @@ class FuzzResult(FuzzItem):
 
             self.chars = len(self.history.content)
             self.lines = self.history.content.count("\n")
-            self.words = len(re.findall(r"\S+", self.history.content))
+            # Same as counting r"\S+" matches, as str.split() uses the same definition of whitespace
+            self.words = len(self.history.content.split())
         # Explicitly resetting these. As recursive requests are copies from the prior FuzzResult object,
         # this otherwise may retain the data from the previous result
         else:
@@ -439,10 +439,25 @@ class FuzzPlugin(FuzzItem):
         FuzzItem.__init__(self, FuzzType.PLUGIN)
         self.name = ""
         self.severity = self.INFO
-        self.message = ""
+        self._message = ""
+        # Arguments the message gets formatted with. Formatting is deferred until the message is read,
+        # which may never happen if the result does not get printed
+        self._message_args: tuple = ()
         self.exception = None
         self.seed: Optional[FuzzResult] = None
 
+    @property
+    def message(self) -> str:
+        if self._message_args:
+            self._message = self._message.format(*self._message_args)
+            self._message_args = ()
+        return self._message
+
+    @message.setter
+    def message(self, message: str):
+        self._message = message
+        self._message_args = ()
+
     def is_visible(self) -> bool:
         """
         Return True if severe enough
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import logging
-import pathlib
+import time
 import warnings
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
 
-from urllib.parse import urljoin
-from wenum.plugin_api.urlutils import parse_url
-from os.path import basename
+from urllib.parse import urljoin, urlparse
 from .plugin_api.static_data import head_extensions
 
 if TYPE_CHECKING:
@@ -16,21 +15,19 @@ if TYPE_CHECKING:
     from wenum.printers import BasePrinter
     from wenum.externals.reqresp.cache import HttpCache
 from threading import Thread, Event, Condition
-from queue import Queue
+from http.cookiejar import DefaultCookiePolicy
 from wenum.externals.reqresp.Response import get_encoding_from_headers
 
 from .factories.fuzzresfactory import resfactory
 from .factories.plugin_factory import plugin_factory
-from .helpers.obj_dic import FixSizeOrderedDict
 from .fuzzobjects import FuzzType, FuzzItem, FuzzWord, FuzzWordType, FuzzResult, FuzzPlugin
 from .myqueues import FuzzQueue, FuzzListQueue
+from .helpers.utils import DaemonThreadPool
 from .exception import (
     FuzzExceptInternalError,
     FuzzExceptBadOptions,
-    FuzzExceptPluginLoadError,
 )
 from .filters.base_filter import BaseFilter
-from .filters.complexfilter import FuzzResFilter
 from .facade import Facade, ERROR_CODE
 from .ui.console.mvc import View
 import requests
@@ -45,6 +42,13 @@ class SeedQueue(FuzzQueue):
     def __init__(self, session: FuzzSession, extensions: list[str]):
         super().__init__(session)
 
+        self.cache: HttpCache = session.cache
+        self.http_pool = session.http_pool
+        self.limit_requests = session.options.limit_requests
+        # Amount of requests HttpQueue may hold before SeedQueue waits for it to catch up
+        self.seed_threshold = session.options.threads * 5
+        # The base FUZZ dir, which the initial recursion is cached with
+        self.initial_recursion_key = session.options.url.replace("FUZZ", "")
         self.extensions = []
 
         for extension in extensions:
@@ -62,7 +66,7 @@ class SeedQueue(FuzzQueue):
         if item and item.discarded:
             self.queue_discard.put(item)
         else:
-            if self.queue_out.qsize() > (self.session.options.threads * 5):
+            if self.queue_out.qsize() > self.seed_threshold:
                 self.queue_out.receive_seed_queue.clear()
             self.queue_out.receive_seed_queue.wait()
             self.queue_out.put(item)
@@ -84,8 +88,8 @@ class SeedQueue(FuzzQueue):
         else:
             raise FuzzExceptInternalError("SeedQueue: Unknown item type in queue!")
 
-        if self.session.options.limit_requests:
-            if not self.session.http_pool.queued_requests > self.session.options.limit_requests:
+        if self.limit_requests:
+            if not self.http_pool.queued_requests > self.limit_requests:
                 self.send_dictionary()
             else:
                 self.end_seed()
@@ -105,8 +109,7 @@ class SeedQueue(FuzzQueue):
         Since on startup there is always a recursion on the base FUZZ dir, it needs to be added to the cache
         to avoid e.g. plugins to enqueue a second recursion on it
         """
-        key = self.session.options.url.replace("FUZZ", "")
-        self.session.cache.check_cache(url_key=key, cache_type="recursion")
+        self.cache.check_cache(url_key=self.initial_recursion_key, cache_type="recursion")
 
     def send_dictionary(self):
         """
@@ -115,39 +118,45 @@ class SeedQueue(FuzzQueue):
         # Ensure that a request is sent to the base of the FUZZ path
         fuzz_word = (FuzzWord("", FuzzWordType.WORD),)
         fuzz_result = self.get_fuzz_res(fuzz_word)
-        if not self.session.cache.check_cache(fuzz_result.url):
+        if not self.cache.check_cache(fuzz_result.url):
             self.stats.pending_fuzz.inc()
             self.send(fuzz_result)
 
         # Check if the payload dictionary is empty to begin with
+        compiled_iterator = self.session.compiled_iterator
         try:
-            fuzz_word = next(self.session.compiled_iterator)
+            fuzz_word = next(compiled_iterator)
         except StopIteration:
             raise FuzzExceptBadOptions("Empty dictionary! Please check payload or filter.")
 
+        # The loop runs once per word of the wordlist, therefore the lookups it needs are bound to locals
+        stats = self.stats
+        check_cache = self.cache.check_cache
+        pending_inc = stats.pending_fuzz.inc
+        get_fuzz_res = self.get_fuzz_res
+        send = self.send
+        extensions = self.extensions
+
         # Enqueue requests
-        try:
-            while fuzz_word:
-                if self.session.compiled_stats.cancelled:
-                    break
-                fuzz_result = self.get_fuzz_res(fuzz_word)
-                # Only send out if it's not already in the cache
-                if not self.session.cache.check_cache(fuzz_result.url):
-                    self.stats.pending_fuzz.inc()
-                    self.send(fuzz_result)
-
-                # generate additional requests for the extensions
-                for extension in self.extensions:
-                    fuzz_word_ext = (FuzzWord(fuzz_word[0][0] + extension, FuzzWordType.WORD),)
-                    fuzz_res_ext = self.get_fuzz_res(fuzz_word_ext)
-
-                    if not self.session.cache.check_cache(fuzz_res_ext.url):
-                        self.stats.pending_fuzz.inc()
-                        self.send(fuzz_res_ext)
-
-                fuzz_word = next(self.session.compiled_iterator)
-        except StopIteration:
-            pass
+        while fuzz_word:
+            if stats.cancelled:
+                break
+            fuzz_result = get_fuzz_res(fuzz_word)
+            # Only send out if it's not already in the cache
+            if not check_cache(fuzz_result.url):
+                pending_inc()
+                send(fuzz_result)
+
+            # generate additional requests for the extensions
+            for extension in extensions:
+                fuzz_word_ext = (FuzzWord(fuzz_word[0][0] + extension, FuzzWordType.WORD),)
+                fuzz_res_ext = get_fuzz_res(fuzz_word_ext)
+
+                if not check_cache(fuzz_res_ext.url):
+                    pending_inc()
+                    send(fuzz_res_ext)
+
+            fuzz_word = next(compiled_iterator, None)
 
         self.end_seed()
 
@@ -170,6 +179,7 @@ class CLIPrinterQueue(FuzzQueue):
         self.pause.set()
 
         self.cli = View(self.session)
+        self.quiet = session.options.quiet
         # Processes discarded results to print them to the progress bar
         self.process_discarded = True
 
@@ -197,8 +207,8 @@ class CLIPrinterQueue(FuzzQueue):
             self.cli.print_result(fuzz_result)
 
         # Progress bar
-        if not self.session.options.quiet:
-            self.cli.update_status(self.session.compiled_stats)
+        if not self.quiet:
+            self.cli.update_status(self.stats)
             if fuzz_result.discarded:
                 self.cli.update_filtered(fuzz_result)
 
@@ -209,6 +219,10 @@ class FilePrinterQueue(FuzzQueue):
     """
     Queue designed to print to files.
     """
+    # Printers rewrite the whole output on every write, therefore writes are bundled. The file gets written once
+    # either enough new results are pending or enough seconds have passed since the last write
+    FLUSH_RESULTS = 256
+    FLUSH_INTERVAL = 2.0
 
     def __init__(self, session: FuzzSession):
         super().__init__(session)
@@ -216,8 +230,9 @@ class FilePrinterQueue(FuzzQueue):
         self.printer_list: list[BasePrinter] = session.compiled_printer_list
         for printer in self.printer_list:
             printer.header(self.stats)
-        # Counter to reduce unnecessary amounts of writes. Write every x requests
-        self.counter = 0
+        # Amount of results that have not been written to file yet
+        self.pending = 0
+        self.last_flush = time.monotonic()
         self.process_discarded = True
 
     def get_name(self):
@@ -231,13 +246,18 @@ class FilePrinterQueue(FuzzQueue):
         if not fuzz_result.discarded:
             for printer in self.printer_list:
                 printer.update_results(fuzz_result, self.stats)
-            # It's not necessary to write to file every request. This counter reduces the frequency
-            if self.counter > 100:
-                self.counter = 0
+            self.pending += 1
+
+        # It's not necessary to write to file every request. Checking the clock for discarded results as well
+        # ensures pending results get written while only filtered ones come in
+        if self.pending:
+            now = time.monotonic()
+            if self.pending >= self.FLUSH_RESULTS or now - self.last_flush >= self.FLUSH_INTERVAL:
+                self.pending = 0
+                self.last_flush = now
                 for printer in self.printer_list:
                     printer.print_to_file()
 
-        self.counter += 1
         self.send(fuzz_result)
 
 
@@ -247,9 +267,10 @@ class RoutingQueue(FuzzQueue):
     Responsible for sending SEED and BACKFEED types of results to their corresponding queues.
     """
 
-    def __init__(self, session: FuzzSession, routes):
+    def __init__(self, session: FuzzSession, routes: dict[FuzzType, FuzzQueue]):
         super().__init__(session)
-        self.routes = routes
+        self.seed_route: FuzzQueue = routes[FuzzType.SEED]
+        self.backfeed_route: FuzzQueue = routes[FuzzType.BACKFEED]
 
     def get_name(self):
         return "RoutingQueue"
@@ -265,11 +286,11 @@ class RoutingQueue(FuzzQueue):
             # allow for fine-grained prioritization within the same seed
             fuzz_result.priority = priority_level
             self.stats.new_seed()
-            self.session.compiled_stats.seed_list.append(fuzz_result.url)
-            self.routes[FuzzType.SEED].put(fuzz_result)
+            self.stats.seed_list.append(fuzz_result.url)
+            self.seed_route.put(fuzz_result)
         elif fuzz_result.item_type == FuzzType.BACKFEED:
             self.stats.new_backfeed()
-            self.routes[FuzzType.BACKFEED].put(fuzz_result)
+            self.backfeed_route.put(fuzz_result)
         else:
             self.send(fuzz_result)
 
@@ -301,14 +322,18 @@ class AutofilterQueue(FuzzQueue):
     Queue activated with the autofilter option. During runtime, it will keep track of the most
     recent kinds of results within a path, and if they repeat too often, will discard those if they occur in that dir.
     """
+    # Amount of different responses that are tracked at once
+    TRACKED_RESPONSES = 15
+    # Amount of times a response has to be seen to get filtered out
+    FILTER_THRESHOLD = 10
 
     def __init__(self, session: FuzzSession):
         super().__init__(session)
 
-        # The filter that gets adjusted during runtime
-        self.filter = FuzzResFilter()
-        # Tracks 15 identifiers from responses in total. If more are found, the oldest one gets removed by expiry (FIFO)
-        self.response_tracker_dict = FixSizeOrderedDict(maximum_length=15)
+        # The (code, lines, words) identifiers that get filtered out, adjusted during runtime
+        self.filtered_responses: set[tuple[int, int, int]] = set()
+        # Tracks 15 identifiers from responses in total. If more are found, the least recently seen one gets removed
+        self.response_tracker_dict: OrderedDict[tuple[int, int, int], int] = OrderedDict()
 
     def get_name(self):
         return "AutofilterQueue"
@@ -320,54 +345,51 @@ class AutofilterQueue(FuzzQueue):
             self.send(fuzz_result)
             return
 
-        # Only process if there isn't a filter (yet) or isn't filtered out by the path's filter
-        if not self.filter.filter_string or not self.filter.is_filtered(fuzz_result):
-            self.update_response_tracker(fuzz_result)
+        response_identifier = (fuzz_result.code, fuzz_result.lines, fuzz_result.words)
+        # Only process if the response isn't filtered out already
+        if response_identifier not in self.filtered_responses:
+            self.update_response_tracker(fuzz_result, response_identifier)
             self.send(fuzz_result)
         else:
             self.discard(fuzz_result)
 
-    def update_response_tracker(self, fuzz_result: FuzzResult):
+    def update_response_tracker(self, fuzz_result: FuzzResult, response_identifier: tuple[int, int, int]):
         """
-        Update the path's dict of how often a response has been seen
+        Update the path's dict of how often a response has been seen. The identifier is supposed to identify
+        duplicate responses
         """
-        # The identifier is supposed to identify duplicate responses
-        response_identifier = f"c={fuzz_result.code} and l={fuzz_result.lines} and w={fuzz_result.words}"
-        try:
-            self.response_tracker_dict[response_identifier] += 1
-            # If it's been detected 10 times, it should be added to the filter
-            if self.response_tracker_dict[response_identifier] >= 10:
-                self.update_filter(fuzz_result, response_identifier)
-                # Tracking a filtered response type is not necessary, therefore gets popped
-                self.response_tracker_dict.pop(response_identifier)
-            else:
-                # When a hit is found, it should be moved to the beginning,
-                # preventing it from getting popped right after
-                self.response_tracker_dict.move_to_end(response_identifier)
-        # If the identifier is not in the dict, simply set the counter to 1. Uncritical exception
-        except KeyError:
-            self.response_tracker_dict[response_identifier] = 1
+        tracker = self.response_tracker_dict
+        hits = tracker.get(response_identifier, 0) + 1
+        # If it's been detected often enough, it should be added to the filter.
+        # Tracking a filtered response type is not necessary, therefore gets popped
+        if hits >= self.FILTER_THRESHOLD:
+            del tracker[response_identifier]
+            self.update_filter(fuzz_result, response_identifier)
+        elif hits > 1:
+            tracker[response_identifier] = hits
+            # When a hit is found, it should be moved to the end, preventing it from getting popped right after
+            tracker.move_to_end(response_identifier)
+        else:
+            if len(tracker) >= self.TRACKED_RESPONSES:
+                tracker.popitem(last=False)
+            tracker[response_identifier] = 1
 
-    def update_filter(self, fuzz_result: FuzzResult, identifier: str):
+    def update_filter(self, fuzz_result: FuzzResult, response_identifier: tuple[int, int, int]):
         """
         Update the filter with the identifier of the response
         """
-        filter_string = f"not ({identifier})"
-        # If a filter already exists, add the next identifier as an additional filter condition.
-        # Duplicate conditions should have no chance of occurring, as responses that already are added once
+        # Duplicate identifiers should have no chance of occurring, as responses that already are added once
         # to the filter should start to get discarded from the beginning
-        if not self.filter.filter_string:
-            self.filter.filter_string = filter_string
-        else:
-            self.filter.filter_string = f"{self.filter.filter_string} and {filter_string}"
+        self.filtered_responses.add(response_identifier)
         if 300 <= fuzz_result.code < 400:
             redirect_string = ". Redirects will still be followed in the background."
         else:
             redirect_string = ""
         fuzz_result.plugins_res.append(
             plugin_factory.create("plugin_from_finding", self.get_name(),
-                                  f"Recurring response detected. Filtering out "
-                                  f"'[u]{identifier}[/u]'{redirect_string}", FuzzPlugin.INFO))
+                                  "Recurring response detected. Filtering out "
+                                  "'[u]c={} and l={} and w={}[/u]'{}", FuzzPlugin.INFO,
+                                  message_args=(*response_identifier, redirect_string)))
 
 
 class PluginQueue(FuzzListQueue):
@@ -377,14 +399,15 @@ class PluginQueue(FuzzListQueue):
 
     def __init__(self, session: FuzzSession):
         # Check active plugins
-        if not [plugin(session) for plugin in Facade().scripts.get_plugins(session.options.plugins_list)]:
+        plugin_classes = Facade().scripts.get_plugins(session.options.plugins_list)
+        if not plugin_classes:
             raise FuzzExceptBadOptions(
                 "No plugin selected, check the --plugins option."
             )
 
         concurrent = session.options.plugin_threads
         # Creating several PluginExecutors to enable several requests to be processed by plugins simultaneously. Dynamically instantiating the plugins to ensure that each PluginExecutor receives its unique objects and avoid any concurrency issues 
-        super().__init__(session, [PluginExecutor(session, [plugin(session) for plugin in Facade().scripts.get_plugins(session.options.plugins_list)]) for i in range(concurrent)])
+        super().__init__(session, [PluginExecutor(session, [plugin(session) for plugin in plugin_classes]) for i in range(concurrent)])
 
     def get_name(self):
         return "PluginQueue"
@@ -397,6 +420,9 @@ class PluginExecutor(FuzzQueue):
     """
     Queue dedicated to handle the execution of plugins. Usually, several instances are created by PluginQueue.
     """
+    # A URL could theoretically cause further backfeeds to be created indefinitely. Taking 15 as an arbitrary
+    # value to avoid infinite backfeeds
+    REQUEUE_LIMIT = 15
 
     def __init__(self, session: FuzzSession, active_plugins: list[BasePlugin]):
         super().__init__(session, maxsize=30)
@@ -404,8 +430,17 @@ class PluginExecutor(FuzzQueue):
         self.cache: HttpCache = session.cache
         self.max_rlevel = session.options.recursion
         self.max_plugin_rlevel = session.options.plugin_recursion
+        self.stop_error = session.options.stop_error
+        self.dry_run = session.options.dry_run
+        self.domain_scope = session.options.domain_scope
+        self.probe_session = RecursiveQueue.build_probe_session(session)
+        self.trusted_codes = frozenset(session.options.trusted_codes_list)
         self.interrupt = Event()
         self.condition = Condition()
+        # The plugins of every processed result run on the same worker threads, so threads are not started per result.
+        # The workers are daemon threads, so a plugin that hangs does not keep the process from exiting
+        self.plugin_pool = DaemonThreadPool(max_workers=max(1, len(active_plugins)),
+                                            thread_name_prefix="PluginExecutor")
 
     def get_name(self) -> str:
         return "PluginExecutor"
@@ -418,6 +453,11 @@ class PluginExecutor(FuzzQueue):
         self.interrupt.set()
         with self.condition:
             self.condition.notify()
+        self.plugin_pool.shutdown(wait=False, cancel_futures=True)
+
+    def cleanup(self):
+        self.plugin_pool.shutdown(wait=False, cancel_futures=True)
+        self.probe_session.close()
 
     def process(self, fuzz_result: FuzzResult) -> None:
         """
@@ -427,8 +467,9 @@ class PluginExecutor(FuzzQueue):
             self.send(fuzz_result)
             return
 
-        # Queue for storing the results of each plugin
-        plugins_res_queue = Queue()
+        # List storing the results of each plugin. Appending is thread-safe, and it is only read after all the
+        # plugins finished
+        plugins_res_list: list[FuzzPlugin] = []
         # Keeps track of the amount of requests queued by each plugin for the request
         queued_dict: dict[dict[str, int]] = {}
         # Keeps track of all the plugins signal for completion
@@ -446,34 +487,35 @@ class PluginExecutor(FuzzQueue):
             queued_dict[plugin.name]["queued_requests"] = 0
             queued_dict[plugin.name]["queued_seeds"] = 0
             try:
-                # Runs all the plugins, stores results in results_queue, and signals completion through
-                # control queue
-                thread = Thread(target=plugin.run, kwargs={"fuzz_result": fuzz_result,
-                                                           "plugin_finished": plugin_finished,
-                                                           "condition": self.condition,
-                                                           "interrupt_signal": self.interrupt,
-                                                           "results_queue": plugins_res_queue, }, )
-                thread.daemon = True
-            except Exception as e:
-                raise FuzzExceptPluginLoadError(f"Error initialising plugin {plugin.name}: {str(e)}")
-            thread.start()
+                # Runs all the plugins, stores results in results_list, and signals completion through
+                # plugin_finished
+                self.plugin_pool.submit(plugin.run, fuzz_result=fuzz_result, plugin_finished=plugin_finished,
+                                        condition=self.condition, interrupt_signal=self.interrupt,
+                                        results_list=plugins_res_list)
+            # Raised if the pool has been shut down by cancel() in the meantime
+            except RuntimeError:
+                break
         with self.condition:
             while True:
-                # On interrupt, empty the plugin_res and close it
+                # On interrupt, the plugin results are dropped
                 if self.interrupt.is_set():
-                    while not plugins_res_queue.empty():
-                        plugins_res_queue.get()
-                        plugins_res_queue.task_done()
-                    plugins_res_queue.join()
                     break
                 elif self.check_all_plugins_done(plugin_signal_dict):
-                    self.process_results(fuzz_result, plugins_res_queue, queued_dict)
+                    self.process_results(fuzz_result, plugins_res_list, queued_dict)
                     break
                 else:
                     self.condition.wait()
 
         self.send(fuzz_result)
 
+    def is_false_positive(self, seed: FuzzResult) -> bool:
+        """
+        Returns True if the seed is deemed a false positive. Seeds responding with a code trusted by the user skip the
+        check
+        """
+        return seed.code not in self.trusted_codes and \
+            RecursiveQueue.false_positive_hit(seed, self.probe_session, self.cache, self.logger)
+
     @staticmethod
     def check_all_plugins_done(plugin_signal_dict: dict):
         """
@@ -486,24 +528,20 @@ class PluginExecutor(FuzzQueue):
         else:
             return True
 
-    def process_results(self, fuzz_result: FuzzResult, plugins_res_queue: Queue,
+    def process_results(self, fuzz_result: FuzzResult, plugins_res_list: list[FuzzPlugin],
                         queued_dict: dict) -> None:
         """
-        Plugin results are polled from plugins_res_queue. Every plugin gets processed. Information gets appended
+        Plugin results are read from plugins_res_list. Every plugin gets processed. Information gets appended
         to the fuzzresult on which the plugins ran, backfeed and seed objects are created if appropriate
         """
-        # A URL could theoretically cause further backfeeds to be created indefinitely. Taking 15 as an arbitrary
-        # value to avoid infinite backfeeds
-        requeue_limit = 15
         # dict containing the plugin names and lists of urls that they wanted to generate which exceeded the limit
         limit_exceeded_urls: dict[str, list[str]] = {}
 
         # Every loop processes a single output of the plugins. One plugin can therefore trigger n loops by creating
         # n outputs, e.g. messages or new requests
-        while not plugins_res_queue.empty():
-            plugin: FuzzPlugin = plugins_res_queue.get()
+        for plugin in plugins_res_list:
             if plugin.exception:
-                if self.session.options.stop_error:
+                if self.stop_error:
                     self._throw(plugin.exception)
 
                 fuzz_result.plugins_res.append(plugin)
@@ -511,33 +549,33 @@ class PluginExecutor(FuzzQueue):
             elif plugin.message and plugin.is_visible():
                 fuzz_result.plugins_res.append(plugin)
             # If it has a seed (BACKFEED/SEED) and goes over http
-            elif plugin.seed and not self.session.options.dry_run:
-                in_scope = fuzz_result.history.check_in_scope(plugin.seed.history.url, self.session.options.domain_scope)
+            elif plugin.seed and not self.dry_run:
+                # The URL is built from its parts on every access, therefore it's only done once
+                seed_url = plugin.seed.url
+                in_scope = fuzz_result.history.check_in_scope(seed_url, self.domain_scope)
                 if not in_scope:
                     continue
                 if plugin.seed.item_type == FuzzType.BACKFEED:
                     cache_type = "processed"
-                    cached = self.cache.check_cache(plugin.seed.url, cache_type=cache_type, update=False)
-                    if cached:
+                    queued_key = "queued_requests"
+                    if plugin.seed.backfeed_level >= self.REQUEUE_LIMIT:
+                        # URLs that are cached already would not have been queued anyway
+                        if not self.cache.check_cache(seed_url, cache_type=cache_type, update=False):
+                            limit_exceeded_urls.setdefault(plugin.name, []).append(
+                                f"[link={seed_url}]{seed_url}[/link]")
                         continue
-                    if plugin.seed.backfeed_level >= requeue_limit:
-                        limit_exceeded_urls.setdefault(plugin.name, []).append(
-                            f"[link={plugin.seed.url}]{plugin.seed.url}[/link]")
-                        continue
-
-                    queued_dict[plugin.name]["queued_requests"] += 1
                 elif plugin.seed.item_type == FuzzType.SEED:
                     cache_type = "recursion"
-                    cached = self.cache.check_cache(plugin.seed.url, cache_type=cache_type, update=False)
-                    if cached:
-                        continue
+                    queued_key = "queued_seeds"
                     # For SEED Plugin objects, the rlevel needs to be checked as well
                     if fuzz_result.plugin_rlevel >= self.max_plugin_rlevel:
                         continue
+                    # Checking the cache first avoids the requests of the false positive check for known URLs
+                    if self.cache.check_cache(seed_url, cache_type=cache_type, update=False):
+                        continue
                     # If the URL is deemed a false positive, don't throw a recursion
-                    elif RecursiveQueue.false_positive_hit(seed=plugin.seed, session=self.session, logger=self.logger):
+                    elif self.is_false_positive(plugin.seed):
                         continue
-                    queued_dict[plugin.name]["queued_seeds"] += 1
                 else:
                     warnings.warn(f"Invalid seed type detected: {plugin.seed.item_type}")
                     continue
@@ -547,28 +585,24 @@ class PluginExecutor(FuzzQueue):
                 #    message=f"Plugin {plugin.name}: Enqueued {plugin.seed.url}",
                 #    severity=FuzzPlugin.INFO))
 
-                # Double-checking the cache. The previous cache checks help avoid extensive checks if it is
-                # in the cache already, but a cache check right before sending the seed is necessary
-                # to reduce race conditions (to fully prevent, cache needs to have threadlocks).
-                if not self.cache.check_cache(plugin.seed.history.url, cache_type=cache_type, update=True):
+                # Checking and updating the cache is atomic, therefore only one queue will send the same URL
+                if not self.cache.check_cache(seed_url, cache_type=cache_type, update=True):
+                    queued_dict[plugin.name][queued_key] += 1
                     self.send(plugin.seed)
-            plugins_res_queue.task_done()
         # After all the individual results have been processed, print the amount of requests queued by each plugin
         for plugin_name, plugin_dict in queued_dict.items():
             # Only if the plugin queued a request at all
             if plugin_dict["queued_requests"]:
                 multiple = "s" if plugin_dict["queued_requests"] > 1 else ""
                 fuzz_result.plugins_res.append(plugin_factory.create(
-                    "plugin_from_finding", name=plugin_name,
-                    message=f"Enqueued [u]{plugin_dict['queued_requests']} request{multiple}[/u]",
-                    severity=FuzzPlugin.INFO))
+                    "plugin_from_finding", name=plugin_name, message="Enqueued [u]{} request{}[/u]",
+                    severity=FuzzPlugin.INFO, message_args=(plugin_dict["queued_requests"], multiple)))
             # Only if the plugin queued a seed at all
             if plugin_dict["queued_seeds"]:
                 multiple = "s" if plugin_dict["queued_seeds"] > 1 else ""
                 fuzz_result.plugins_res.append(plugin_factory.create(
-                    "plugin_from_finding", name=plugin_name,
-                    message=f"Enqueued [u]{plugin_dict['queued_seeds']} seed{multiple}[/u]",
-                    severity=FuzzPlugin.INFO))
+                    "plugin_from_finding", name=plugin_name, message="Enqueued [u]{} seed{}[/u]",
+                    severity=FuzzPlugin.INFO, message_args=(plugin_dict["queued_seeds"], multiple)))
         # Print the URLs that have not been requeued due to the limit
         if limit_exceeded_urls:
             output_string = ""
@@ -577,7 +611,8 @@ class PluginExecutor(FuzzQueue):
 
             fuzz_result.plugins_res.append(plugin_factory.create(
                 "plugin_from_finding", name=self.name,
-                message=f"The following plugins intended to queue URLs that exceed the limit of 15 in a chain. "
+                message=f"The following plugins intended to queue URLs that exceed the limit of {self.REQUEUE_LIMIT} "
+                        f"in a chain. "
                         f"To avoid infinite re-queueing, the listed URLs have not been queued again.\n"
                         f"{output_string}",
                 severity=FuzzPlugin.INFO))
@@ -592,10 +627,9 @@ class RedirectQueue(FuzzQueue):
         super().__init__(session)
 
         self.cache = session.cache
-        self.regex_header = [
-            ("Link", re.compile(r"<(.*)>;")),
-            ("Location", re.compile(r"(.*)")),
-        ]
+        self.domain_scope = session.options.domain_scope
+        # Only the Link header needs extracting, as the Location value is the URL itself
+        self.link_regex = re.compile(r"<(.*?)>;")
 
     def get_name(self):
         return "RedirectQueue"
@@ -604,23 +638,29 @@ class RedirectQueue(FuzzQueue):
         if not 300 <= fuzz_result.code < 400:
             self.send(fuzz_result)
             return
-        for header, regex in self.regex_header:
-            if header in fuzz_result.history.headers.response:
-                link = fuzz_result.history.headers.response[header]
-                if link:
-                    self.enqueue_link(fuzz_result, link)
+        # Every access to headers.response builds a new header dict, therefore it is only done once
+        response_headers = fuzz_result.history.headers.response
+        link = response_headers.get("Link")
+        if link:
+            link_match = self.link_regex.search(link)
+            if link_match:
+                self.enqueue_link(fuzz_result, link_match.group(1))
+        location = response_headers.get("Location")
+        if location:
+            self.enqueue_link(fuzz_result, location)
         self.send(fuzz_result)
 
     def enqueue_link(self, fuzz_result, link_url):
-        parsed_link = parse_url(link_url)
-
-        filename = basename(parsed_link.path)
-        extension = pathlib.Path(filename).suffix
+        # Same result as pathlib's suffix, without building a Path object. A leading dot (e.g. .htaccess) or a
+        # trailing one do not mark an extension
+        filename = urlparse(link_url).path.rpartition("/")[2]
+        dot = filename.rfind(".")
+        extension = filename[dot:] if 0 < dot < len(filename) - 1 else ""
 
         # Join both URLs. If it's relative, will append to the base URL. Otherwise, will use link_url's netloc
         target_url = urljoin(fuzz_result.url, link_url)
 
-        in_scope = fuzz_result.history.check_in_scope(target_url, domain_based=self.session.options.domain_scope)
+        in_scope = fuzz_result.history.check_in_scope(target_url, domain_based=self.domain_scope)
         if not in_scope:
             fuzz_result.plugins_res.append(plugin_factory.create(
                 "plugin_from_finding", name=self.get_name(),
@@ -647,17 +687,23 @@ class RecursiveQueue(FuzzQueue):
     another directory (e.g. /FUZZ -> /admin/FUZZ). It's important to note that it will only do so if, by evaluation,
     it looks like an endpoint was found which acts as a directory.
     """
-
     def __init__(self, session: FuzzSession):
         super().__init__(session)
 
         self.cache = session.cache
         self.max_rlevel = session.options.recursion
         self.max_plugin_rlevel = session.options.plugin_recursion
+        self.http_pool = session.http_pool
+        self.limit_requests = session.options.limit_requests
+        self.probe_session = self.build_probe_session(session)
+        self.trusted_codes = frozenset(session.options.trusted_codes_list)
 
     def get_name(self):
         return "RecursiveQueue"
 
+    def cleanup(self):
+        self.probe_session.close()
+
     def process(self, fuzz_result: FuzzResult):
         # If it is not a directory, no recursion will be queued
         if not fuzz_result.history.request_found_directory():
@@ -673,8 +719,7 @@ class RecursiveQueue(FuzzQueue):
         if self.cache.check_cache(recursion_url, cache_type="recursion", update=False):
             pass
         # Don't recurse if request limiting is active and threshold is reached
-        elif self.session.options.limit_requests and self.session.http_pool.queued_requests > \
-                self.session.options.limit_requests:
+        elif self.limit_requests and self.http_pool.queued_requests > self.limit_requests:
             fuzz_result.plugins_res.append(
                 plugin_factory.create("plugin_from_finding", self.get_name(),
                                       f"Skipped recursion - limiting requests as per argument for "
@@ -686,14 +731,13 @@ class RecursiveQueue(FuzzQueue):
                                       f"Skipped recursion - " + max_recursion_condition +
                                       f" for {recursion_url}", FuzzPlugin.INFO))
         # Or if the recursion URL is deemed a false positive. This check should be the last, as it is the costliest.
-        elif self.false_positive_hit(seed, self.session, self.logger):
+        elif self.is_false_positive(seed):
             fuzz_result.plugins_res.append(
                 plugin_factory.create("plugin_from_finding", self.get_name(),
                                       f"Permanent redirect detected for "
                                       f"{recursion_url} - skipped recursion", FuzzPlugin.INFO))
-        # Double-checking the cache. The previous cache checks help avoid extensive checks if it is
-        # in the cache already, but a cache check right before sending the seed is necessary
-        # to reduce race conditions.
+        # Checking the cache again, as another queue may have sent the seed in the meantime. Checking and updating
+        # the cache is atomic, therefore only one of them will send it.
         elif not self.cache.check_cache(recursion_url, cache_type="recursion", update=True):
             # Send the seed
             self.send(seed)
@@ -704,6 +748,14 @@ class RecursiveQueue(FuzzQueue):
         # Sends the current request into the next queue
         self.send(fuzz_result)
 
+    def is_false_positive(self, seed: FuzzResult) -> bool:
+        """
+        Returns True if the seed is deemed a false positive. Seeds responding with a code trusted by the user skip the
+        check
+        """
+        return seed.code not in self.trusted_codes and \
+            self.false_positive_hit(seed, self.probe_session, self.cache, self.logger)
+
     def max_recursion_condition(self, fuzz_result: FuzzResult) -> str:
         """
         Method to check whether max recursions are reached. If it is a backfed object (hence coming from a plugin), it
@@ -719,32 +771,57 @@ class RecursiveQueue(FuzzQueue):
             return ""
 
     @staticmethod
-    def false_positive_hit(seed: FuzzResult, session: FuzzSession, logger: logging.Logger) -> bool:
+    def build_probe_session(session: FuzzSession) -> requests.Session:
+        """
+        Returns the requests session used for the junk requests of false_positive_hit. Its headers and proxies are
+        compiled by the session once, and reusing it keeps the connections to the target alive between checks.
+        Each queue builds its own, as the session is only used by the thread of the queue
+        """
+        probe_session = requests.Session()
+        probe_session.headers.update(session.probe_headers_dict)
+        probe_session.proxies = dict(session.probe_proxy_dict)
+        probe_session.verify = False
+        # Each probe has to look like a fresh request. Rejecting every cookie keeps the server from seeing a
+        # session built up by earlier probes, and spares the jar from storing them
+        probe_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return probe_session
+
+    @staticmethod
+    def false_positive_hit(seed: FuzzResult, probe_session: requests.Session, cache: HttpCache,
+                           logger: logging.Logger) -> bool:
         """
         Checks whether server responds with something that looks like a hit an endpoint that does not exist,
         based on the URL of the FuzzResult
         Returns True if it is a false positive, False if it is legitimate
+
+        The verdicts are memoized keyed on the recursion URL together with the status code and word count of the seed,
+        as siblings below the same parent may legitimately differ
         """
-        if session.options.proxy_list:
-            proxy_string = session.options.proxy_list[0]
-            proxy_dict = {"http": proxy_string,
-                          "https": proxy_string}
-        else:
-            proxy_dict = ""
-        if session.options.header_dict():
-            headers_dict = session.options.header_dict()
-        else:
-            headers_dict = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:60.0) Gecko/20100101 Firefox/60.0"
-            }
-        check_string = "thisdoesnotexist123"
         recursion_url = seed.history.url
-        check_url = recursion_url.replace("FUZZ", check_string)
+        verdict_key = (recursion_url, seed.code, seed.words)
+        verdict = cache.get_memo(verdict_key, memo_type="false_positive")
+        if verdict is not None:
+            return verdict
         try:
-            junk_response_tuple = RecursiveQueue._get_response_tuple(check_url, headers_dict, proxy_dict)
+            verdict = RecursiveQueue._compare_junk_responses(seed, recursion_url, probe_session, cache)
         except Exception as e:
-            logger.exception(f"Exception in false_positive_hit during first junk response")
+            # Not remembered, a later check may be able to reach the target again
+            logger.exception(f"Exception in false_positive_hit during junk response")
             return False
+        cache.set_memo(verdict_key, verdict, memo_type="false_positive")
+        return verdict
+
+    @staticmethod
+    def _compare_junk_responses(seed: FuzzResult, recursion_url: str, probe_session: requests.Session,
+                                cache: HttpCache) -> bool:
+        """
+        Compares the seed to the responses of endpoints that should not exist below the same parent path
+        """
+        # Split once, both check URLs are joined from the parts
+        url_parts = recursion_url.split("FUZZ")
+        check_url = "thisdoesnotexist123".join(url_parts)
+        junk_response_tuple = RecursiveQueue._get_cached_response_tuple(check_url, probe_session, cache,
+                                                                        expected_code=seed.code)
         # If the status code and word count of the junk response is identical, it's pretty much guaranteed to be
         # a false positive
         if junk_response_tuple[0] == seed.code and junk_response_tuple[1] == seed.words:
@@ -754,13 +831,9 @@ class RecursiveQueue(FuzzQueue):
             return False
         # Lastly, if the word count is different, but the status code is the same, a third request should be compared
         # as things are hard to determine (dynamic response content may play a part):
-        check_string = "thisalsodoesnotexist123"
-        check_url = recursion_url.replace("FUZZ", check_string)
-        try:
-            second_junk_response_tuple = RecursiveQueue._get_response_tuple(check_url, headers_dict, proxy_dict)
-        except Exception as e:
-            logger.exception(f"Exception in false_positive_hit during second junk response")
-            return False
+        check_url = "thisalsodoesnotexist123".join(url_parts)
+        second_junk_response_tuple = RecursiveQueue._get_cached_response_tuple(
+            check_url, probe_session, cache, expected_code=junk_response_tuple[0])
         # If both junk responses are identical, whereas it has been established prior that the word count differs to the
         # original request, the original one was unique and therefore not a false positive
         if second_junk_response_tuple[0] == junk_response_tuple[0] and \
@@ -771,16 +844,41 @@ class RecursiveQueue(FuzzQueue):
         return True
 
     @staticmethod
-    def _get_response_tuple(check_url, headers_dict, proxy_dict) -> tuple[int, int]:
+    def _get_cached_response_tuple(check_url, probe_session: requests.Session, cache: HttpCache,
+                                   expected_code: Optional[int] = None) -> tuple[int, Optional[int]]:
+        """
+        Wraps _get_response_tuple with the wildcard probe memo. The probed URL only depends on the parent path of a
+        seed, therefore only the first sibling below it has to send the request
+        """
+        cached_tuple = cache.get_memo(check_url, memo_type="wildcard_probe")
+        # A cached entry without word length can only be used if the status code settles the comparison
+        if cached_tuple is not None and (cached_tuple[1] is not None or cached_tuple[0] != expected_code):
+            return cached_tuple
+        response_tuple = RecursiveQueue._get_response_tuple(check_url, probe_session, expected_code=expected_code)
+        cache.set_memo(check_url, response_tuple, memo_type="wildcard_probe")
+        return response_tuple
+
+    @staticmethod
+    def _get_response_tuple(check_url, probe_session: requests.Session,
+                            expected_code: Optional[int] = None) -> tuple[int, Optional[int]]:
         """
         Send out the request, parse the response and return it in a tuple, where the first entry is the
         response status code, and the second entry is the word length
+
+        If the status code differs from expected_code, the words are not compared by the caller. The body is then
+        not downloaded, and the word length is None
         """
         try:
-            junk_response = requests.get(check_url, verify=False,
-                                         headers=headers_dict, allow_redirects=False, proxies=proxy_dict)
+            # The proxies are passed explicitly, as proxies from the environment would otherwise take precedence
+            # over the ones of the session
+            junk_response = probe_session.get(check_url, stream=True, allow_redirects=False,
+                                              proxies=probe_session.proxies)
         except Exception as e:
             raise Exception
+        if expected_code is not None and junk_response.status_code != expected_code:
+            # Closing returns the connection without reading the body
+            junk_response.close()
+            return junk_response.status_code, None
         encoding = get_encoding_from_headers(junk_response.headers)
         # fallback to default encoding
         if encoding is None:
@@ -788,7 +886,8 @@ class RecursiveQueue(FuzzQueue):
         junk_string_content = junk_response.content.decode(encoding, errors="replace")
         # No line comparison as of right now
         # junk_lines = string_content.count("\n")
-        junk_words = len(re.findall(r"\S+", junk_string_content))
+        # str.split() splits on the same whitespace as the regex r"\S+" FuzzResult uses, without running a regex
+        junk_words = len(junk_string_content.split())
         return junk_response.status_code, junk_words
 
 
@@ -823,6 +922,9 @@ class HttpQueue(FuzzQueue):
         super().__init__(session)
 
         self.http_pool = session.http_pool
+        self.stop_error = session.options.stop_error
+        # Has to match SeedQueue's threshold, otherwise SeedQueue may wait on an event that never gets set
+        self.seed_threshold = session.options.threads * 5
 
         # Listening for keypress to pause execution
         self.pause = Event()
@@ -845,9 +947,11 @@ class HttpQueue(FuzzQueue):
         # will put another item into the HttpQueue, and then start its own stopping routine.
         self.receive_seed_queue.set()
 
+        # Cleared before putting the stop tuple, as the reading thread may set it again before this thread gets
+        # to clear it otherwise, which would leave the wait without anyone to set it
+        self.thread_cancelled.clear()
         # Putting a stop tuple with the highest priority
         self.http_pool.result_queue.put((0, None, None))
-        self.thread_cancelled.clear()
         self.thread_cancelled.wait()
 
         self.http_pool.thread_cancelled.clear()
@@ -875,7 +979,7 @@ class HttpQueue(FuzzQueue):
         self.pause.wait()
         # SeedQueue clears the event and waits for unblock if it sees too many items in HttpQueue queued.
         # If there aren't too many items already waiting, then allow SeedQueue to send more again.
-        if self.qsize() <= (self.session.options.threads * 5):
+        if self.qsize() <= self.seed_threshold:
             self.receive_seed_queue.set()
         self.http_pool.enqueue(fuzz_result)
 
@@ -884,17 +988,20 @@ class HttpQueue(FuzzQueue):
         Function running in thread to continuously monitor http request results. It practically behaves like a queue
         which gets items that have been put in and processes them.
         """
-        while True:
-            fuzz_result, requeue = next(self.http_pool.iter_results())
+        # Bound once, as they are looked up for every single response
+        enqueue = self.http_pool.enqueue
+        send = self.send
+        stop_error = self.stop_error
+        for fuzz_result, requeue in self.http_pool.iter_results():
             if not fuzz_result:
                 break
             if requeue:
-                self.http_pool.enqueue(fuzz_result)
+                enqueue(fuzz_result)
             else:
-                if fuzz_result.exception and self.session.options.stop_error:
+                if fuzz_result.exception and stop_error:
                     self._throw(fuzz_result.exception)
                 else:
-                    self.send(fuzz_result)
+                    send(fuzz_result)
         self.logger.debug("__read_http_results stopped")
         self.thread_cancelled.set()
 
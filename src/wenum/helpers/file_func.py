@@ -1,5 +1,6 @@
 import os
 import sys
+from collections import deque
 import pkg_resources
 
 from chardet.universaldetector import UniversalDetector
@@ -81,7 +82,8 @@ class FileDetOpener:
     ]
 
     def __init__(self, file_path, encoding=None):
-        self.cache = []
+        # Lines read while detecting the encoding, replayed in order before reading on
+        self.cache = deque()
         self.file_des = open(file_path, mode="rb")
         self.det_encoding = encoding
         self.encoding_forced = False
@@ -92,6 +94,17 @@ class FileDetOpener:
     def reset(self):
         self.file_des.seek(0)
 
+    def count_lines(self) -> int:
+        """
+        Counts the lines of the file and resets it. Each raw line decodes into exactly one line, so they are counted
+        without detecting the encoding or decoding them
+        """
+        self.reset()
+        self.cache.clear()
+        line_count = sum(1 for _ in self.file_des)
+        self.reset()
+        return line_count
+
     def __iter__(self):
         return self
 
@@ -110,7 +123,7 @@ class FileDetOpener:
 
             if line is None:
                 if self.cache:
-                    line = self.cache.pop()
+                    line = self.cache.popleft()
                 else:
                     line = next(self.file_des)
                     if not line:
@@ -1,4 +1,5 @@
 import functools
+import operator
 from .obj_dic import DotDict
 
 
@@ -69,3 +70,12 @@ def rgetattr(obj, attr, *args):
     # raise AttributeError("Unknown field {}".format(attr))
 
     return functools.reduce(_getattr, [obj] + attr.split("."))
+
+
+@functools.lru_cache(maxsize=256)
+def rgetattr_accessor(attr):
+    """
+    Returns a callable equivalent to rgetattr(obj, attr) for the given attr. The aliases get resolved once, and the
+    returned attrgetter walks the attribute chain in C, which pays off when the same attr gets read repeatedly.
+    """
+    return operator.attrgetter(".".join(_get_alias(part) for part in attr.split(".")))
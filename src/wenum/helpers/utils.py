@@ -1,4 +1,5 @@
-from threading import Lock
+from queue import SimpleQueue, Empty
+from threading import Lock, Thread
 import difflib
 
 
@@ -23,6 +24,60 @@ class MyCounter:
             return self._count
 
 
+class DaemonThreadPool:
+    """
+    Minimal thread pool running the submitted calls on daemon threads. Unlike concurrent.futures.ThreadPoolExecutor,
+    whose workers get joined when the interpreter exits, a call that never returns does not keep the process alive
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._tasks: SimpleQueue = SimpleQueue()
+        self._shutdown = False
+        self._mutex = Lock()
+        self._workers = [Thread(target=self._work, name=f"{thread_name_prefix}_{index}", daemon=True)
+                         for index in range(max_workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, fn, *args, **kwargs) -> None:
+        """
+        Queues the call for the next free worker. Raises RuntimeError after shutdown, like ThreadPoolExecutor
+        """
+        with self._mutex:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new calls after shutdown")
+            self._tasks.put((fn, args, kwargs))
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Stops the workers once they are done with their current call. With cancel_futures, queued calls that did not
+        start yet are dropped. With wait, blocks until the workers finished
+        """
+        with self._mutex:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                try:
+                    while True:
+                        self._tasks.get_nowait()
+                except Empty:
+                    pass
+            for _ in self._workers:
+                self._tasks.put(None)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _work(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            fn, args, kwargs = task
+            fn(*args, **kwargs)
+
+
 def diff(param1, param2):
     delta = difflib.unified_diff(
         str(param1).splitlines(False),
@@ -113,15 +113,14 @@ class HttpPool:
 
     def iter_results(self):
         """
-        Method to receive the next item from the queue which stores the results of all the requests sent
+        Generator receiving the items from the queue which stores the results of all the requests sent. It blocks
+        until the next result arrives, and is meant to be iterated over by a single consumer
         """
-        queue_output = self.result_queue.get()
-        self.result_queue.task_done()
-        priority = queue_output[0]
-        item = queue_output[1]
-        requeue = queue_output[2]
-
-        yield item, requeue
+        result_queue = self.result_queue
+        while True:
+            priority, item, requeue = result_queue.get()
+            result_queue.task_done()
+            yield item, requeue
 
     def _prepare_curl_h(self, curl_h, fuzz_result):
         """
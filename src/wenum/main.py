@@ -120,12 +120,8 @@ def _filter_subdirectory_hits(stats: FuzzStats) -> str:
     stats keeps a record of the hit count within each subdirectory. This function is called to do some processing.
     It's only considered relevant for the user to know if there are at least x amount of hits within a subdir
     """
-    # Order alphabetically
-    sorted_hits = dict(sorted(stats.subdir_hits.items()))
-    line_separated_dirs = ""
-    # Only count those that have a minimum amount of hits
-    for subdir, hits in sorted_hits.items():
-        if hits > 50:
-            line_separated_dirs += subdir + ": " + str(hits) + "\n"
-
-    return line_separated_dirs
+    # Only count those that have a minimum amount of hits, and order them alphabetically. Filtering first keeps the
+    # sort small, as most subdirectories have few hits
+    frequent_hits = sorted((subdir, hits) for subdir, hits in stats.subdir_hits.items() if hits > 50)
+
+    return "".join(["%s: %s\n" % subdir_hits for subdir_hits in frequent_hits])
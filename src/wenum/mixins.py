@@ -70,7 +70,7 @@ class FuzzRequestUrlMixing:
         Returns True if it found a directory, and False if it did not.
         """
         stripped_url = self._request.url_without_variables
-        if (self.code in [200, 401, 403]) and stripped_url[-1] == "/":
+        if self.code in {200, 401, 403} and stripped_url[-1] == "/":
             return True
         else:
             return False
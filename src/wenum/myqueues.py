@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 import queue
-import time
 from typing import TYPE_CHECKING
 
 from typing import Optional
@@ -221,11 +220,16 @@ class FuzzQueue(FuzzPriorityQueue, Thread, ABC):
 
     def empty_queue(self):
         """
-        Empties the queued items right before stopping the runtime
+        Empties the queued items right before stopping the runtime. Instead of a get() and task_done() per item,
+        the underlying heap is cleared at once while holding the queue's mutex
         """
-        while self.qsize() > 0:
-            self.get()
-            self.task_done()
+        with self.mutex:
+            dropped = len(self.queue)
+            self.queue.clear()
+            self.unfinished_tasks -= dropped
+            if not self.unfinished_tasks:
+                self.all_tasks_done.notify_all()
+            self.not_full.notify_all()
 
 
 class MonitorQueue(FuzzQueue):
@@ -297,13 +301,16 @@ class FuzzListQueue(FuzzQueue, ABC):
     Queue with a list of output queues.
     Instead of the "parent" A sending every item to the queue_out Z like an ordinary FuzzQueue,
     it may choose to send items to all their children [B, C, D],
-    or randomly to one of their children, e.g. only to C.
+    or to one of their children in turns, e.g. only to C.
     The children respectively have queue_out Z as their next queue.
     The children are not managed by QueueManager. FuzzListQueue needs to cascade information to them instead.
 
     If the FuzzListQueue doesn't need to process discarded items but its children should do so, the parent should
     forward the items in the process() method with send_to_any()/send_to_all(), depending on the current use case.
     """
+    # Seconds send_to_any() waits on a single child while all of them are full
+    SEND_TO_ANY_TIMEOUT = 0.05
+
     def __init__(self, session, queues_out: list[FuzzQueue], maxsize=0):
         super().__init__(session=session, maxsize=maxsize)
         # Tuple containing the outqueue and a bool indicating whether it is currently blocking
@@ -410,22 +417,23 @@ class FuzzListQueue(FuzzQueue, ABC):
 
     def send_to_any(self, item):
         """
-        Randomly send to one in the list
-        """
-        next_queue: FuzzQueue = next(self._next_queue)
-        try:
-            next_queue.put(item, block=False)
-            self.blocking_list[self.current_index] = False
-        # If the queue is full, indicate the current queue as blocking, and call the function again.
-        # Will pull the next queue, and try that out
-        except queue.Full:
-            self.blocking_list[self.current_index] = True
-            # If every queue_out blocked, wait a little before trying again
-            # (This is more performant than the timeout parameter of put(), as this only waits if *all* queue_outs
-            # blocked, instead of always waiting for the timeout of a single offender)
-            if False not in self.blocking_list:
-                time.sleep(0.5)
-            self.send(item)
+        Send to one in the list, taking turns. Children that are full are skipped
+        """
+        while True:
+            next_queue: FuzzQueue = next(self._next_queue)
+            try:
+                # If every queue_out blocked, wait for the current one to free up a slot. put() waits on the queue's
+                # condition, so it returns as soon as the child takes an item. The timeout is kept short, as any of
+                # the other children may free up a slot first
+                if False not in self.blocking_list:
+                    next_queue.put(item, timeout=self.SEND_TO_ANY_TIMEOUT)
+                else:
+                    next_queue.put(item, block=False)
+                self.blocking_list[self.current_index] = False
+                return
+            # If the queue is full, indicate the current queue as blocking and try the next one
+            except queue.Full:
+                self.blocking_list[self.current_index] = True
 
     def _get_next_route(self):
         while 1:
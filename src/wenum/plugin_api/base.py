@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from wenum.runtime_session import FuzzSession
-    from queue import Queue
 from wenum.fuzzobjects import FuzzPlugin, FuzzResult
 from wenum.exception import (
     FuzzExceptBadOptions,
@@ -27,8 +26,8 @@ class BasePlugin:
     def __init__(self, session: FuzzSession):
         # Setting disabled to true will cause it not to execute for future requests anymore
         self.disabled = False
-        # The results queue is the queue receiving all the plugin output. PluginExecutor will later read it
-        self.results_queue: Optional[Queue] = None
+        # The results list is receiving all the plugin output. PluginExecutor will read it once the plugin finished
+        self.results_list: Optional[list[FuzzPlugin]] = None
         # Bool indicating whether plugin should only be run once. PluginExecutor will disable after first execution
         self.run_once = False
         # Plugins might adjust the FuzzResult object passed into them. This contains the original state
@@ -50,19 +49,19 @@ class BasePlugin:
             if param_name not in list(self.kbase.keys()):
                 self.kbase[param_name] = default_value
 
-    def run(self, fuzz_result: FuzzResult, plugin_finished: Event, condition: Condition, interrupt_signal: Event, results_queue: Queue) -> None:
+    def run(self, fuzz_result: FuzzResult, plugin_finished: Event, condition: Condition, interrupt_signal: Event, results_list: list[FuzzPlugin]) -> None:
         """
         Will be triggered by PluginExecutor
         """
         try:
             self.interrupt = interrupt_signal
-            self.results_queue = results_queue
+            self.results_list = results_list
             self.base_fuzz_res = fuzz_result
             self.process(fuzz_result)
         except Exception as e:
             self.logger.exception(f"An exception occured while running the plugin {self.name}")
             exception_plugin = plugin_factory.create("plugin_from_error", self.name, e)
-            results_queue.put(exception_plugin)
+            results_list.append(exception_plugin)
         finally:
             # Signal back completion of execution
             plugin_finished.set()
@@ -126,12 +125,12 @@ class BasePlugin:
     def put_if_okay(self, fuzz_plugin) -> None:
         """
         Checks for the interrupt signal for plugins. If the interrupt is set, nothing will be put into
-        the result queue. Otherwise, it will simply do so.
+        the results list. Otherwise, it will simply do so.
         """
         if self.interrupt.is_set():
             return
         else:
-            self.results_queue.put(fuzz_plugin)
+            self.results_list.append(fuzz_plugin)
 
     @staticmethod
     def _bool(value) -> bool:
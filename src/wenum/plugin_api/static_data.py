@@ -1,7 +1,7 @@
 # File to contain static data of plugins that may be shared or simply clutters the plugin file itself
 
-head_extensions = [".gif", ".jpg", ".zip", ".png", ".exe", ".pdf", ".apk", ".ipa"]
-valid_codes = [200, 301, 302, 303, 307, 308]
+head_extensions = frozenset({".gif", ".jpg", ".zip", ".png", ".exe", ".pdf", ".apk", ".ipa"})
+valid_codes = frozenset({200, 301, 302, 303, 307, 308})
 
 # Dictionary containing dir names that map to a specific technology
 dir_to_tech = {
@@ -180,85 +180,92 @@ ERRORS_regex_list = [
     "supplied argument is not a valid MySQL result resource",
 ]
 
-HEADERS_server_headers = ["server", "x-powered-by" "via"]
+HEADERS_server_headers = frozenset({"server", "x-powered-by", "via"})
 
-HEADERS_common_response_headers_regex_list = [
-    r"^Server$",
-    r"^X-Powered-By$",
-    r"^Via$",
-    r"^Access-Control.*$",
-    r"^Accept-.*$",
-    r"^age$",
-    r"^allow$",
-    r"^Cache-control$",
-    r"^Client-.*$",
-    r"^Connection$",
-    r"^Content-.*$",
-    r"^Cross-Origin-Resource-Policy$",
-    r"^Date$",
-    r"^Etag$",
-    r"^Expires$",
-    r"^Keep-Alive$",
-    r"^Last-Modified$",
-    r"^Link$",
-    r"^Location$",
-    r"^P3P$",
-    r"^Pragma$",
-    r"^Proxy-.*$",
-    r"^Refresh$",
-    r"^Retry-After$",
-    r"^Referrer-Policy$",
-    r"^Set-Cookie$",
-    r"^Server-Timing$",
-    r"^Status$",
-    r"^Strict-Transport-Security$",
-    r"^Timing-Allow-Origin$",
-    r"^Trailer$",
-    r"^Transfer-Encoding$",
-    r"^Upgrade$",
-    r"^Vary$",
-    r"^Warning^$",
-    r"^WWW-Authenticate$",
-    r"^X-Content-Type-Options$",
-    r"^X-Download-Options$",
-    r"^X-Frame-Options$",
-    r"^X-Microsite$",
-    r"^X-Request-Handler-Origin-Region$",
-    r"^X-XSS-Protection$",
-]
+# The header names are stored lowered, as they are case-insensitive. Headers starting with one of the prefixes are
+# common as well
+HEADERS_common_response_headers = frozenset({
+    "server",
+    "x-powered-by",
+    "via",
+    "age",
+    "allow",
+    "cache-control",
+    "connection",
+    "cross-origin-resource-policy",
+    "date",
+    "etag",
+    "expires",
+    "keep-alive",
+    "last-modified",
+    "link",
+    "location",
+    "p3p",
+    "pragma",
+    "refresh",
+    "retry-after",
+    "referrer-policy",
+    "set-cookie",
+    "server-timing",
+    "status",
+    "strict-transport-security",
+    "timing-allow-origin",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+    "vary",
+    "warning",
+    "www-authenticate",
+    "x-content-type-options",
+    "x-download-options",
+    "x-frame-options",
+    "x-microsite",
+    "x-request-handler-origin-region",
+    "x-xss-protection",
+})
 
-HEADERS_common_req_headers_regex_list = [
-    r"A-IM$",
-    r"Accept$",
-    r"Accept-.*$",
-    r"Access-Control-.*$",
-    r"Authorization$",
-    r"Cache-Control$",
-    r"Connection$",
-    r"Content-.*$",
-    r"Cookie$",
-    r"Date$",
-    r"Expect$",
-    r"Forwarded$",
-    r"From$",
-    r"Host$",
-    r"If-.*$",
-    r"Max-Forwards$",
-    r"Origin$",
-    r"Pragma$",
-    r"Proxy-Authorization$",
-    r"Range$",
-    r"Referer$",
-    r"TE$",
-    r"User-Agent$",
-    r"Upgrade$",
-    r"Upgrade-Insecure-Requests$",
-    r"Via$",
-    r"Warning$",
-    r"X-Requested-With$",
-    r"X-HTTP-Method-Override$",
-    r"X-Requested-With$",
-]
+HEADERS_common_response_header_prefixes = (
+    "access-control",
+    "accept-",
+    "client-",
+    "content-",
+    "proxy-",
+)
+
+HEADERS_common_req_headers = frozenset({
+    "a-im",
+    "accept",
+    "authorization",
+    "cache-control",
+    "connection",
+    "cookie",
+    "date",
+    "expect",
+    "forwarded",
+    "from",
+    "host",
+    "max-forwards",
+    "origin",
+    "pragma",
+    "proxy-authorization",
+    "range",
+    "referer",
+    "te",
+    "user-agent",
+    "upgrade",
+    "upgrade-insecure-requests",
+    "via",
+    "warning",
+    "x-requested-with",
+    "x-http-method-override",
+})
+
+HEADERS_common_req_header_prefixes = (
+    "accept-",
+    "access-control-",
+    "content-",
+    "if-",
+)
 
 LISTING_dir_indexing_regexes = ["<title>Index of /",
                                 '<a href="\\?C=N;O=D">Name</a>',
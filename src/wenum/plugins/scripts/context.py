@@ -54,7 +54,7 @@ class Context(BasePlugin):
 
     def validate(self, fuzz_result: FuzzResult):
         # Don't process if filtered out
-        if not self.check_filter_options(fuzz_result) or fuzz_result.code not in [403, 200, 401]:
+        if not self.check_filter_options(fuzz_result) or fuzz_result.code not in {403, 200, 401}:
             return False
 
         # If a dir was found or if the response redirects to a dir
@@ -1,21 +1,22 @@
 from wenum.plugin_api.base import BasePlugin
 from wenum.externals.moduleman.plugin import moduleman_plugin
-from wenum.plugin_api.static_data import HEADERS_server_headers, HEADERS_common_response_headers_regex_list, \
-    HEADERS_common_req_headers_regex_list
-
-import re
+from wenum.plugin_api.static_data import HEADERS_server_headers, HEADERS_common_response_headers, \
+    HEADERS_common_response_header_prefixes, HEADERS_common_req_headers, HEADERS_common_req_header_prefixes
 
 KBASE_KEY = "http.servers"
 KBASE_KEY_RESP_UNCOMMON = "http.response.headers.uncommon"
 KBASE_KEY_REQ_UNCOMMON = "http.request.headers.uncommon"
+# The kbase lists only grow, therefore each of them is mirrored into a set stored under this suffix for lookups
+KBASE_SET_SUFFIX = "_set"
+
+
+def _is_common_request_header(header_lower: str) -> bool:
+    return header_lower in HEADERS_common_req_headers or header_lower.startswith(HEADERS_common_req_header_prefixes)
 
-COMMON_RESPONSE_HEADERS_REGEX = re.compile(
-    "({})".format("|".join(HEADERS_common_response_headers_regex_list)), re.IGNORECASE
-)
 
-COMMON_REQ_HEADERS_REGEX = re.compile(
-    "({})".format("|".join(HEADERS_common_req_headers_regex_list)), re.IGNORECASE
-)
+def _is_common_response_header(header_lower: str) -> bool:
+    return header_lower in HEADERS_common_response_headers or \
+        header_lower.startswith(HEADERS_common_response_header_prefixes)
 
 
 @moduleman_plugin
@@ -37,51 +38,56 @@ class Headers(BasePlugin):
 
     def __init__(self, session):
         BasePlugin.__init__(self, session)
+        # The kbase is shared between all instances. Plugins are instantiated before the runtime starts,
+        # so the sets are not created twice
+        for key in (KBASE_KEY, KBASE_KEY_RESP_UNCOMMON, KBASE_KEY_REQ_UNCOMMON):
+            if not self.kbase[key + KBASE_SET_SUFFIX]:
+                self.kbase[key + KBASE_SET_SUFFIX] = set(self.kbase[key])
+        # Every kbase access takes its lock, and the lists and sets are never replaced. Binding them once keeps
+        # the checks from looking them up for every header
+        self.seen_servers: set[str] = self.kbase[KBASE_KEY + KBASE_SET_SUFFIX][0]
+        self.server_list: list[str] = self.kbase[KBASE_KEY]
+        self.seen_resp_uncommon: set[str] = self.kbase[KBASE_KEY_RESP_UNCOMMON + KBASE_SET_SUFFIX][0]
+        self.resp_uncommon_list: list[str] = self.kbase[KBASE_KEY_RESP_UNCOMMON]
+        self.seen_req_uncommon: set[str] = self.kbase[KBASE_KEY_REQ_UNCOMMON + KBASE_SET_SUFFIX][0]
+        self.req_uncommon_list: list[str] = self.kbase[KBASE_KEY_REQ_UNCOMMON]
 
     def validate(self, fuzz_result):
         return True
 
     def check_request_header(self, header, value):
-        header_value = None
-        if not COMMON_REQ_HEADERS_REGEX.match(header):
-            header_value = header
-
-        if header_value is not None:
-            if (
-                    header_value.lower() not in self.kbase[KBASE_KEY_REQ_UNCOMMON]
-                    or KBASE_KEY_REQ_UNCOMMON not in self.kbase
-            ):
-                self.add_information(f"New uncommon HTTP request header: "
-                                     f"[u]{header_value}[/u]: [u]{value}[/u]")
-                self.kbase[KBASE_KEY_REQ_UNCOMMON].append(header_value.lower())
-
-    def check_response_header(self, fuzz_result, header):
-        header_value = None
-        if not COMMON_RESPONSE_HEADERS_REGEX.match(header):
-            header_value = header
+        header_lower = header.lower()
+        if _is_common_request_header(header_lower):
+            return
+        if header_lower not in self.seen_req_uncommon:
+            self.add_information(f"New uncommon HTTP request header: "
+                                 f"[u]{header}[/u]: [u]{value}[/u]")
+            self.seen_req_uncommon.add(header_lower)
+            self.req_uncommon_list.append(header_lower)
 
-        if header_value is not None:
-            if (
-                    header_value.lower() not in self.kbase[KBASE_KEY_RESP_UNCOMMON]
-                    or KBASE_KEY_RESP_UNCOMMON not in self.kbase
-            ):
+    def check_response_header(self, header, header_lower, value):
+        """
+        Classifies the response header in one go. The server headers are common ones, so they are never uncommon
+        """
+        if header_lower in HEADERS_server_headers:
+            self.check_server_header(value)
+        elif not _is_common_response_header(header_lower):
+            if header_lower not in self.seen_resp_uncommon:
                 self.add_information(f"New uncommon HTTP response header: "
-                                     f"[u]{header_value}[/u]: [u]{header_value}[/u]")
-                self.kbase[KBASE_KEY_RESP_UNCOMMON].append(header_value.lower())
+                                     f"[u]{header}[/u]: [u]{value}[/u]")
+                self.seen_resp_uncommon.add(header_lower)
+                self.resp_uncommon_list.append(header_lower)
 
-    def check_server_header(self, header, value):
-        if header.lower() in HEADERS_server_headers:
-            if (
-                    value.lower() not in self.kbase[KBASE_KEY]
-                    or KBASE_KEY not in self.kbase
-            ):
-                self.add_information(f"New HTTP server header: [u]{value}[/u]")
-                self.kbase[KBASE_KEY].append(value.lower())
+    def check_server_header(self, value):
+        value_lower = value.lower()
+        if value_lower not in self.seen_servers:
+            self.add_information(f"New HTTP server header: [u]{value}[/u]")
+            self.seen_servers.add(value_lower)
+            self.server_list.append(value_lower)
 
     def process(self, fuzz_result):
         for header, value in fuzz_result.history.headers.request.items():
             self.check_request_header(header, value)
 
         for header, value in fuzz_result.history.headers.response.items():
-            self.check_response_header(fuzz_result, header)
-            self.check_server_header(header, value)
+            self.check_response_header(header, header.lower(), value)
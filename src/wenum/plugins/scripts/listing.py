@@ -25,7 +25,7 @@ class Listing(BasePlugin):
             self.regex.append(re.compile(i, re.MULTILINE | re.DOTALL))
 
     def validate(self, fuzz_result):
-        return fuzz_result.code in [200]
+        return fuzz_result.code == 200
 
     def process(self, fuzz_result):
         for r in self.regex:
@@ -27,7 +27,7 @@ class Screenshot(BasePlugin):
         BasePlugin.__init__(self, session)
 
     def validate(self, fuzz_result):
-        return fuzz_result.code not in [404]
+        return fuzz_result.code != 404
 
     def process(self, fuzz_result):
         temp_name = next(tempfile._get_candidate_names())
@@ -35,7 +35,7 @@ class Sourcemap(BasePlugin):
         BasePlugin.__init__(self, session)
 
     def validate(self, fuzz_result):
-        if fuzz_result.code in [200] and self.check_filter_options(fuzz_result):
+        if fuzz_result.code == 200 and self.check_filter_options(fuzz_result):
             return True
 
         return False
@@ -10,6 +10,21 @@ from .exception import FuzzExceptPluginError
 import sys
 from abc import abstractmethod, ABC
 
+# Removing ansi color escapes when logging, which plugins may
+# have inserted (magic from https://stackoverflow.com/a/14693789)
+# 7-bit C1 ANSI sequences
+ANSI_ESCAPE_REGEX = re.compile(r"""
+    \x1B  # ESC
+    (?:   # 7-bit C1 Fe (except CSI)
+        [@-Z\\-_]
+    |     # or [ for CSI, followed by a control sequence
+        \[
+        [0-?]*  # Parameter bytes
+        [ -/]*  # Intermediate bytes
+        [@-~]   # Final byte
+    )
+""", re.VERBOSE)
+
 
 class BasePrinter(ABC):
     """
@@ -25,7 +40,8 @@ class BasePrinter(ABC):
         # List containing every result information
         self.result_list = []
         if output:
-            self.outputfile_handle = open(output, "w")
+            # The whole output gets written at once, a large buffer keeps it from being split into many writes
+            self.outputfile_handle = open(output, "w", buffering=1 << 20)
         else:
             self.outputfile_handle = sys.stdout
 
@@ -103,21 +119,7 @@ class JSON(BasePrinter):
         plugin_dict = {}
 
         for plugin in fuzz_result.plugins_res:
-            # Removing ansi color escapes when logging, which plugins may
-            # have inserted (magic from https://stackoverflow.com/a/14693789)
-            # 7-bit C1 ANSI sequences
-            ansi_escape = re.compile(r"""
-                \x1B  # ESC
-                (?:   # 7-bit C1 Fe (except CSI)
-                    [@-Z\\-_]
-                |     # or [ for CSI, followed by a control sequence
-                    \[
-                    [0-?]*  # Parameter bytes
-                    [ -/]*  # Intermediate bytes
-                    [@-~]   # Final byte
-                )
-            """, re.VERBOSE)
-            result = ansi_escape.sub('', plugin.message)
+            result = ANSI_ESCAPE_REGEX.sub('', plugin.message)
             plugin_dict[plugin.name] = result
 
         res_entry = {
@@ -41,6 +41,9 @@ class FuzzSession:
         self.compiled_printer_list: list[BasePrinter] = []
         self.compiled_iterator: Optional[BaseIterator] = None
         self.current_priority_level: int = PRIORITY_STEP
+        # Headers and proxies of the requests sent outside the HttpPool, e.g. the false positive checks
+        self.probe_headers_dict: dict = {}
+        self.probe_proxy_dict: dict = {}
 
         self.cache: HttpCache = HttpCache(cache_dir=self.options.cache_dir)
         self.http_pool: Optional[HttpPool] = None
@@ -80,7 +83,7 @@ class FuzzSession:
         #TODO Verify this is polling the amount of FUZZ words supplied by the user
         """
         if self.compiled_filter:
-            fuzz_words = self.compiled_filter.get_fuzz_words()
+            fuzz_words = list(self.compiled_filter.get_fuzz_words())
         else:
             fuzz_words = []
 
@@ -94,6 +97,19 @@ class FuzzSession:
             "dictio_from_options", self
         )
 
+    def compile_probe_dicts(self):
+        if self.options.proxy_list:
+            proxy_string = self.options.proxy_list[0]
+            self.probe_proxy_dict = {"http": proxy_string,
+                                     "https": proxy_string}
+        else:
+            self.probe_proxy_dict = {}
+        self.probe_headers_dict = self.options.header_dict()
+        if not self.probe_headers_dict:
+            self.probe_headers_dict = {
+                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:60.0) Gecko/20100101 Firefox/60.0"
+            }
+
     def compile_seeds(self):
         self.compiled_seed = resfactory.create("seed_from_options", self)
 
@@ -124,6 +140,7 @@ class FuzzSession:
 
         self.compile_seeds()
         self.compile_iterator()
+        self.compile_probe_dicts()
 
         # filter options
         self.compiled_simple_filter = FuzzResSimpleFilter.from_options(self)
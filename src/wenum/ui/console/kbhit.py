@@ -4,7 +4,12 @@ import os
 
 # Windows
 if os.name == 'nt':
+    import ctypes
     import msvcrt
+    import time
+
+    STD_INPUT_HANDLE = -10
+    WAIT_OBJECT_0 = 0
 
 # Posix (Linux, OS X)
 else:
@@ -20,7 +25,8 @@ class KBHit:
         """Creates a KBHit object that you can call to do various keyboard things."""
 
         if os.name == "nt":
-            pass
+            self.kernel32 = ctypes.windll.kernel32
+            self.stdin_handle = self.kernel32.GetStdHandle(STD_INPUT_HANDLE)
 
         else:
 
@@ -56,7 +62,9 @@ class KBHit:
             return msvcrt.getch().decode('utf-8')
 
         else:
-            return sys.stdin.read(1)
+            # Reading the file descriptor directly, as characters buffered by sys.stdin would not be reported by the
+            # select in kbhit()
+            return os.read(self.fd, 1).decode('utf-8', errors='replace')
 
     def getarrow(self):
         """ Returns an arrow-key code after kbhit() has been called. Codes are
@@ -78,12 +86,23 @@ class KBHit:
 
         return vals.index(ord(c.decode('utf-8')))
 
-    def kbhit(self):
+    def kbhit(self, timeout: float = 0):
         """ Returns True if keyboard character was hit, False otherwise.
+        Blocks for up to timeout seconds while waiting for input.
         """
         if os.name == 'nt':
-            return msvcrt.kbhit()
+            if msvcrt.kbhit():
+                return True
+            if timeout <= 0:
+                return False
+            if self.kernel32.WaitForSingleObject(self.stdin_handle, int(timeout * 1000)) == WAIT_OBJECT_0:
+                if msvcrt.kbhit():
+                    return True
+                # The handle also gets signaled by pending non-key events (e.g. focus or mouse), which stay in the
+                # input buffer. Sleeping out the timeout keeps the caller from spinning on them
+                time.sleep(timeout)
+            return False
 
         else:
-            dr,dw,de = select([sys.stdin], [], [], 0)
+            dr,dw,de = select([self.fd], [], [], timeout)
             return dr != []
@@ -1,7 +1,11 @@
 import datetime
+import functools
+import itertools
+import shutil
+import signal
 import time
-from collections import defaultdict
 import threading
+from typing import Optional
 
 import rich.console
 from rich.columns import Columns
@@ -12,6 +16,7 @@ from wenum.factories.fuzzresfactory import resfactory
 from wenum.fuzzobjects import FuzzWordType, FuzzResult, FuzzStats
 from rich.live import Live
 from rich.panel import Panel
+from rich.rule import Rule
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from rich.table import Table, Column
 from rich.console import Console
@@ -36,13 +41,15 @@ class SimpleEventDispatcher:
     """
 
     def __init__(self):
-        self.publisher = defaultdict(list)
+        # Subscriptions only happen on startup, while notifications happen on every key press. The subscribers are
+        # therefore kept in tuples, which get replaced on a subscription
+        self.publisher: dict[str, tuple] = {}
 
     def create_event(self, msg):
         """
         Create a listener for the provided keypress
         """
-        self.publisher[msg] = []
+        self.publisher[msg] = ()
 
     def subscribe(self, func, msg, dynamic=False):
         """
@@ -51,14 +58,15 @@ class SimpleEventDispatcher:
         if msg not in self.publisher and not dynamic:
             raise KeyError("subscribe. No such event: %s" % msg)
         else:
-            self.publisher[msg].append(func)
+            self.publisher[msg] = self.publisher.get(msg, ()) + (func,)
 
     def notify(self, msg, **event):
-        if msg not in self.publisher:
-            raise KeyError("notify. Event not subscribed: %s" % msg)
-        else:
-            for functor in self.publisher[msg]:
-                functor(**event)
+        try:
+            functors = self.publisher[msg]
+        except KeyError:
+            raise KeyError("notify. Event not subscribed: %s" % msg) from None
+        for functor in functors:
+            functor(**event)
 
 
 class KeyPress(threading.Thread):
@@ -72,31 +80,44 @@ class KeyPress(threading.Thread):
         self.name = "KeyPress"
 
         self.dispatcher = SimpleEventDispatcher()
-        self.dispatcher.create_event("h")
-        self.dispatcher.create_event("p")
-        self.dispatcher.create_event("s")
-        self.dispatcher.create_event("r")
-        self.dispatcher.create_event("d")
+        # Each key press is dispatched as the event of the same name
+        self.events = frozenset("hpsrd")
+        for event in self.events:
+            self.dispatcher.create_event(event)
+        # Events that toggle state, so that repeating them is not redundant
+        self.toggle_events = frozenset("p")
 
         self.do_job = True
 
+    # Seconds to block waiting for input before checking whether the job was cancelled
+    INPUT_TIMEOUT = 0.5
+    # Maximum amount of already pending key presses that are read and coalesced at once
+    MAX_BURST = 8
+
     def cancel_job(self):
         self.do_job = False
+        # Give the terminal back right away instead of only at interpreter exit
+        self.inkey.set_normal_term()
 
     def run(self):
         while self.do_job:
-            if self.inkey.kbhit():
-                pressed_char = self.inkey.getch()
-                if pressed_char == "p":
-                    self.dispatcher.notify("p", key="p")
-                elif pressed_char == "s":
-                    self.dispatcher.notify("s", key="s")
-                elif pressed_char == "h":
-                    self.dispatcher.notify("h", key="h")
-                elif pressed_char == "r":
-                    self.dispatcher.notify("r", key="r")
-                elif pressed_char == "d":
-                    self.dispatcher.notify("d", key="d")
+            if self.inkey.kbhit(self.INPUT_TIMEOUT):
+                self.dispatch_burst()
+
+    def dispatch_burst(self):
+        """
+        Reads the pending key presses and dispatches them. Bursts (e.g. pasted input) would otherwise print the same
+        message over and over, therefore repeated keys are only dispatched once unless they toggle state
+        """
+        pressed_chars = [self.inkey.getch()]
+        while len(pressed_chars) < self.MAX_BURST and self.inkey.kbhit():
+            pressed_chars.append(self.inkey.getch())
+
+        previous_char = None
+        for pressed_char in pressed_chars:
+            if pressed_char in self.events and (pressed_char != previous_char or pressed_char in self.toggle_events):
+                self.dispatcher.notify(pressed_char, key=pressed_char)
+            previous_char = pressed_char
 
 
 class Controller:
@@ -110,6 +131,12 @@ class Controller:
         self.view = view
         self.__paused = False
         self.stats: FuzzStats = fuzzer.session.compiled_stats
+        self.console: Console = fuzzer.session.console
+        # The rules framing the messages are constant, so they are only created once
+        self.closing_rule = Rule(style="yellow")
+        self.help_message = (Rule("Usage", style="yellow"), usage, self.closing_rule)
+        self.pause_rule = Rule("'P' pressed - pausing requests.", style="yellow")
+        self.resume_rule = Rule("Resuming execution...", style="yellow")
 
         self.view.dispatcher.subscribe(self.on_help, "h")
         self.view.dispatcher.subscribe(self.on_pause, "p")
@@ -117,90 +144,80 @@ class Controller:
         self.view.dispatcher.subscribe(self.on_seeds, "r")
         self.view.dispatcher.subscribe(self.on_debug, "d")
 
+    def print_message(self, title: str, message: str):
+        """
+        Prints the message framed by rules with a single console call
+        """
+        self.console.print(Rule(title, style="yellow"), message, self.closing_rule)
+
     def on_help(self, **event):
-        self.fuzzer.session.console.rule("Usage", style="yellow")
-        self.fuzzer.session.console.print(usage)
-        self.fuzzer.session.console.rule(style="yellow")
+        self.console.print(*self.help_message)
 
     def on_pause(self, **event):
         self.__paused = not self.__paused
         if self.__paused:
             self.fuzzer.pause_job()
-            self.fuzzer.session.console.rule("'P' pressed - pausing requests.", style="yellow")
+            self.console.print(self.pause_rule)
         else:
-            self.fuzzer.session.console.rule("Resuming execution...", style="yellow")
+            self.console.print(self.resume_rule)
             self.fuzzer.resume_job()
 
     def on_stats(self, **event):
         pending_requests = self.stats.total_req - self.stats.processed()
         pending_seeds = self.stats.pending_seeds()
         stats = self.stats
-        message = f"""Requests Per Seed: {str(stats.wordlist_req)}
-Pending Requests: {str(pending_requests)}
-Pending Seeds: {str(pending_seeds)}\n"""
+        lines = [f"Requests Per Seed: {stats.wordlist_req}",
+                 f"Pending Requests: {pending_requests}",
+                 f"Pending Seeds: {pending_seeds}"]
 
         if stats.backfeed() > 0:
-            message += f"""Total Backfed/Plugin Requests: {stats.backfeed()}
-Processed Requests: {(str(stats.processed())[:8])}
-Filtered Requests: {(str(stats.filtered())[:8])}\n"""
+            lines.append(f"Total Backfed/Plugin Requests: {stats.backfeed()}")
+            lines.append(f"Processed Requests: {str(stats.processed())[:8]}")
+            lines.append(f"Filtered Requests: {str(stats.filtered())[:8]}")
         totaltime = time.time() - stats.starttime
         req_sec = (stats.processed() / totaltime if totaltime > 0 else 0)
         totaltime_formatted = datetime.timedelta(seconds=int(totaltime))
-        message += f"Total Time: {str(totaltime_formatted)}\n"
+        lines.append(f"Total Time: {totaltime_formatted}")
         if req_sec > 0:
-            message += f"Requests/Sec.: {str(req_sec)[:8]}\n"
+            lines.append(f"Requests/Sec.: {str(req_sec)[:8]}")
             eta = pending_requests / req_sec
             if eta > 60:
-                message += f"ET Left Min.: {str(eta / 60)[:8]}"
+                lines.append(f"ET Left Min.: {str(eta / 60)[:8]}")
             else:
-                message += f"ET Left Sec.: {str(eta)[:8]}"
+                lines.append(f"ET Left Sec.: {str(eta)[:8]}")
+        message = "\n".join(lines)
 
-        self.fuzzer.session.console.rule("Runtime stats", style="yellow")
-        self.fuzzer.session.console.print(message)
-        self.fuzzer.session.console.rule(style="yellow")
+        self.print_message("Runtime stats", message)
 
     def on_debug(self, **event):
         """
         Print some debug information
         """
-        message = ""
-        stats = self.fuzzer.stats()
-        for key, value in list(stats.items()):
-            message += f"{key}: {value}\n"
-        message = message.rstrip("\n")
-        self.fuzzer.session.console.rule("Debug stats", style="yellow")
-        self.fuzzer.session.console.print(message)
-        self.fuzzer.session.console.rule(style="yellow")
+        message = "\n".join(f"{key}: {value}" for key, value in self.fuzzer.stats().items())
+        self.print_message("Debug stats", message)
 
     def on_seeds(self, **event):
         """Print information about currently queued seeds"""
         seed_list_len = str(len(self.stats.seed_list))
         seed_message = f"In total, {seed_list_len} seeds have been generated. List of seeds:\n"
-        colored_url_list = "[ "
         parsed_initial_url = parse_url(self.stats.url)
+        colored_urls = []
         for seed_url in self.stats.seed_list:
-            parsed_seed_url = parse_url(seed_url)
-            seed_url = seed_url
-            scheme = parsed_seed_url.scheme
-            netloc = parsed_seed_url.netloc
+            scheme, netloc, path = parse_url(seed_url)[:3]
+            # Params, query and fragment are kept as they are
+            remainder = seed_url[len(scheme) + 3 + len(netloc) + len(path):]
             # Only color the scheme and netloc if they are different from the initial ones
             if scheme != parsed_initial_url.scheme:
-                colored_scheme = "[yellow]" + scheme + "[/yellow]"
-                seed_url.replace(parsed_seed_url.scheme, colored_scheme)
+                scheme = f"[yellow]{scheme}[/yellow]"
             if netloc != parsed_initial_url.netloc:
-                colored_netloc = "[yellow]" + netloc + "[/yellow]"
-                seed_url.replace(parsed_seed_url.netloc, colored_netloc)
-            colored_path = "[yellow]" + parsed_seed_url.path + "[/yellow]"
-            seed_url = seed_url.replace(parsed_seed_url.path, colored_path)
-            # Imitating the look of a list when printed out. Reason for not simply using a list is because the terminal
-            # does not properly handle the Colour codes when using lists
-            colored_url_list += "'" + seed_url + "', "
-
-        colored_url_list += "]"
+                netloc = f"[yellow]{netloc}[/yellow]"
+            colored_urls.append(f"'{scheme}://{netloc}[yellow]{path}[/yellow]{remainder}', ")
+
+        # Imitating the look of a list when printed out. Reason for not simply using a list is because the terminal
+        # does not properly handle the Colour codes when using lists
+        colored_url_list = "[ " + "".join(colored_urls) + "]"
         seed_message += colored_url_list
-        self.fuzzer.session.console.rule("Seed stats", style="yellow")
-        self.fuzzer.session.console.print(seed_message)
-        self.fuzzer.session.console.rule(style="yellow")
+        self.print_message("Seed stats", seed_message)
 
 
 class View:
@@ -218,10 +235,27 @@ class View:
         "size": 10,
         "http_method": 7,
     }
+    # Seconds after which the terminal size gets queried again on platforms without SIGWINCH
+    TERMINAL_SIZE_REFRESH = 0.5
+    # Minimum seconds between two updates of the filtered responses
+    FILTERED_REFRESH = 0.1
 
     def __init__(self, session):
         self.verbose = session.options.verbose
         self.console: Console = session.console
+        self.response_grid_columns = self.build_response_grid_columns()
+        self.code_column_index = 2 if self.verbose else 0
+        self.filtered_deadline = 0.0
+        self.pending_filtered: Optional[FuzzResult] = None
+        # Rich queries the terminal size with a syscall every time it renders something unless the console size is
+        # set. The size is therefore pinned and only refreshed when the terminal gets resized
+        self.size_deadline: Optional[float] = None
+        if self.console.is_terminal:
+            self.refresh_console_size()
+            if hasattr(signal, "SIGWINCH") and threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGWINCH, self.refresh_console_size)
+            else:
+                self.size_deadline = time.monotonic() + self.TERMINAL_SIZE_REFRESH
 
         # Progress bar
         self.next_task = self._get_next_task()
@@ -298,40 +332,65 @@ class View:
             progress_table.columns[1].ratio = 20
             self.live = Live(progress_table, auto_refresh=True, console=self.console)
 
+    def refresh_console_size(self, *_):
+        """
+        Pins the console to the current terminal size. Doubles as the SIGWINCH handler
+        """
+        terminal_size = shutil.get_terminal_size()
+        self.console.size = (terminal_size.columns, terminal_size.lines)
+
+    def check_console_size(self):
+        """
+        Refreshes the pinned console size once the refresh interval passed. Only relevant without SIGWINCH
+        """
+        if self.size_deadline is not None and time.monotonic() >= self.size_deadline:
+            self.refresh_console_size()
+            self.size_deadline = time.monotonic() + self.TERMINAL_SIZE_REFRESH
+
     def update_status(self, stats):
         """
         Updates the progress bar's values
         """
+        self.check_console_size()
         self.overall_progress.update(self.overall_task, total_req=stats.total_req, processed=stats.processed())
+        # Shows a filtered result that was held back, once it is due
+        self.flush_filtered()
 
     def update_filtered(self, fuzz_result: FuzzResult):
         """
-        Update the filtered bar's values with the provided discarded FuzzResult
+        Update the filtered bar's values with the provided discarded FuzzResult. Discarded results usually arrive far
+        faster than they could be read, therefore the updates are limited to one per FILTERED_REFRESH seconds. A result
+        arriving in between is kept and displayed by the next due update, unless a newer one replaces it
         """
-        server = ""
-        if "Server" in fuzz_result.history.headers.response:
-            server = fuzz_result.history.headers.response["Server"]
+        self.pending_filtered = fuzz_result
+        self.flush_filtered()
+
+    def flush_filtered(self):
+        """
+        Displays the pending filtered result if the refresh interval passed
+        """
+        fuzz_result = self.pending_filtered
+        if fuzz_result is None:
+            return
+        now = time.monotonic()
+        if now < self.filtered_deadline:
+            return
+        self.filtered_deadline = now + self.FILTERED_REFRESH
+        self.pending_filtered = None
+
+        # The headers get rebuilt on every access, and the server is only displayed in verbose mode
+        server = fuzz_result.history.headers.response.get("Server", "") if self.verbose else ""
 
         self.filtered_progress.update(next(self.next_task), response_time=fuzz_result.timer, server=server,
-                                      http_code=str(fuzz_result.code),
-                                      lines=str(fuzz_result.lines) + " L",
-                                      words=str(fuzz_result.words) + " W", size=str(fuzz_result.chars) + " B",
+                                      http_code=f"{fuzz_result.code}", lines=f"{fuzz_result.lines} L",
+                                      words=f"{fuzz_result.words} W", size=f"{fuzz_result.chars} B",
                                       http_method=fuzz_result.history.method, endpoint=fuzz_result.url)
 
     def _get_next_task(self):
         """
         Infinitely loops through the 3 tasks that display filtered results.
         """
-        index = 0
-        while True:
-            if index == 0:
-                yield self.recent_filtered_task
-            elif index == 1:
-                yield self.middle_filtered_task
-            elif index == 2:
-                yield self.oldest_filtered_task
-            index += 1
-            index = index % 3
+        yield from itertools.cycle((self.recent_filtered_task, self.middle_filtered_task, self.oldest_filtered_task))
 
     @staticmethod
     def get_opt_value(opt_value):
@@ -371,6 +430,7 @@ class View:
         """
         Prints the FuzzResult in its designated grid format
         """
+        self.check_console_size()
 
         if fuzz_result.history.redirect_header:
             location = fuzz_result.history.full_redirect_url
@@ -378,10 +438,6 @@ class View:
         else:
             url_output = f"[link={fuzz_result.url}]{fuzz_result.url}[/link]"
 
-        server = ""
-        if "Server" in fuzz_result.history.headers.response:
-            server = fuzz_result.history.headers.response["Server"]
-
         if fuzz_result.exception:
             response_code = "XXX"
             response_code_color = "purple"
@@ -392,77 +448,81 @@ class View:
         grid = self.create_response_grid(response_code_color)
 
         # Add fuzz_result contents
+        row = (f"{response_code}", f"{fuzz_result.lines} L", f"{fuzz_result.words} W", f"{fuzz_result.chars} B",
+               fuzz_result.history.method, url_output)
         if self.verbose:
-            grid.add_row(str(fuzz_result.timer), str(server),
-                         str(response_code), str(fuzz_result.lines) + " L", str(fuzz_result.words) + " W",
-                         str(fuzz_result.chars) + " B", fuzz_result.history.method, url_output)
-        else:
-            grid.add_row(str(response_code), str(fuzz_result.lines) + " L", str(fuzz_result.words) + " W",
-                         str(fuzz_result.chars) + " B", fuzz_result.history.method, url_output)
+            server = fuzz_result.history.headers.response.get("Server", "")
+            row = (f"{fuzz_result.timer}", f"{server}") + row
+        grid.add_row(*row)
 
-        # Add plugin results
-        if fuzz_result.plugins_res:
+        renderables = [grid]
+        # Add plugin results. Most results have none to display, in which case no plugin grid gets built and rendered
+        if self.verbose:
+            plugin_results = fuzz_result.plugins_res
+        else:
+            plugin_results = [plugin_res for plugin_res in fuzz_result.plugins_res if plugin_res.is_visible()]
+        if plugin_results:
             plugin_grid = Table.grid(pad_edge=True, padding=(0, 1), collapse_padding=False)
             plugin_grid.add_column("name", min_width=20, max_width=20, no_wrap=False, overflow="fold")
             plugin_grid.add_column("message", no_wrap=False, overflow="fold")
             # Plugin rows should iterate colors for easier visual distinction
             color = True
-            for plugin_res in fuzz_result.plugins_res:
-                if not plugin_res.is_visible() and not self.verbose:
-                    continue
+            for plugin_res in plugin_results:
                 plugin_grid.add_row(f"[i]{plugin_res.name}[/i]:", plugin_res.message,
                                     style="orange3" if color else "deep_pink3")
                 color = not color
+            renderables.append(plugin_grid)
 
+        # Entering the console buffers the rule, the grids and the exception, so that the whole result gets written
+        # and flushed once instead of once per print call
+        with self.console:
             self.console.rule(f"[dim]Response number {fuzz_result.result_number}:[/dim]", style="dim green")
-            self.console.print(grid, plugin_grid, soft_wrap=True)
-        else:
-            self.console.rule(f"[dim]Response number {fuzz_result.result_number}:[/dim]", style="dim green")
-            self.console.print(grid, soft_wrap=True)
+            self.console.print(*renderables, soft_wrap=True)
 
-        # Add exception information
-        if fuzz_result.exception:
-            self.console.print(f" [b]ERROR[/b]: {fuzz_result.exception}")
+            # Add exception information
+            if fuzz_result.exception:
+                self.console.print(f" [b]ERROR[/b]: {fuzz_result.exception}")
 
     def create_response_grid(self, response_code_color: str) -> rich.table.Table:
         """
         Creates the grid format with which to print the response metrics
         """
         grid = Table.grid(pad_edge=True, padding=(0, 1), collapse_padding=False)
-
-        if self.verbose:
-            grid.add_column("Response Time", min_width=self.fuzzresult_row_widths["response_time"],
-                            max_width=self.fuzzresult_row_widths["response_time"], no_wrap=False, overflow="crop")
-            grid.add_column("Server", min_width=self.fuzzresult_row_widths["server"],
-                            max_width=self.fuzzresult_row_widths["server"], no_wrap=False, overflow="fold")
-
-        grid.add_column("HTTP Code", min_width=self.fuzzresult_row_widths["http_code"],
-                        max_width=self.fuzzresult_row_widths["http_code"], no_wrap=False, overflow="fold")
-        grid.add_column("Lines", min_width=self.fuzzresult_row_widths["lines"],
-                        max_width=self.fuzzresult_row_widths["lines"], no_wrap=False, overflow="fold", justify="right")
-        grid.add_column("Words", min_width=self.fuzzresult_row_widths["words"],
-                        max_width=self.fuzzresult_row_widths["words"], no_wrap=False, overflow="fold", justify="right")
-        grid.add_column("Size", min_width=self.fuzzresult_row_widths["size"],
-                        max_width=self.fuzzresult_row_widths["size"], no_wrap=False, overflow="fold", justify="right")
-        grid.add_column("HTTP Method", min_width=self.fuzzresult_row_widths["http_method"],
-                        max_width=self.fuzzresult_row_widths["http_method"], no_wrap=False, overflow="fold")
-        grid.add_column("URL", no_wrap=False, overflow="fold")
-
-        # Set colors
-        code_column_index = 0
-        if self.verbose:
-            grid.columns[0].style = "pale_green1"
-            grid.columns[1].style = "sky_blue2"
-            code_column_index = 2
-        grid.columns[code_column_index].style = response_code_color
-        grid.columns[code_column_index + 1].style = "magenta"
-        grid.columns[code_column_index + 2].style = "cyan"
-        grid.columns[code_column_index + 3].style = "yellow"
-        grid.columns[code_column_index + 4].style = "slate_blue1"
+        for header, column_options in self.response_grid_columns:
+            grid.add_column(header, **column_options)
+        grid.columns[self.code_column_index].style = response_code_color
 
         return grid
 
+    def build_response_grid_columns(self) -> list[tuple[str, dict]]:
+        """
+        Builds the column definitions of the response grid. They only depend on the verbosity, so they get built
+        once instead of for every printed result. The style of the HTTP code column is set per response
+        """
+        widths = self.fuzzresult_row_widths
+        columns = []
+        if self.verbose:
+            columns.append(("Response Time", dict(min_width=widths["response_time"], max_width=widths["response_time"],
+                                                  no_wrap=False, overflow="crop", style="pale_green1")))
+            columns.append(("Server", dict(min_width=widths["server"], max_width=widths["server"], no_wrap=False,
+                                           overflow="fold", style="sky_blue2")))
+
+        columns.append(("HTTP Code", dict(min_width=widths["http_code"], max_width=widths["http_code"], no_wrap=False,
+                                          overflow="fold")))
+        columns.append(("Lines", dict(min_width=widths["lines"], max_width=widths["lines"], no_wrap=False,
+                                      overflow="fold", justify="right", style="magenta")))
+        columns.append(("Words", dict(min_width=widths["words"], max_width=widths["words"], no_wrap=False,
+                                      overflow="fold", justify="right", style="cyan")))
+        columns.append(("Size", dict(min_width=widths["size"], max_width=widths["size"], no_wrap=False,
+                                     overflow="fold", justify="right", style="yellow")))
+        columns.append(("HTTP Method", dict(min_width=widths["http_method"], max_width=widths["http_method"],
+                                            no_wrap=False, overflow="fold", style="slate_blue1")))
+        columns.append(("URL", dict(no_wrap=False, overflow="fold")))
+
+        return columns
+
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_response_code_color(code: int):
         """
         Takes an HTTP response code (e.g. 302) and returns the color that it should be printed with on the CLI
@@ -157,6 +157,9 @@ class Options:
         self.limit_requests: Optional[int] = None
         self.opt_name_limit_requests: str = "limit-requests"
 
+        self.trusted_codes_list: list[int] = []
+        self.opt_name_trusted_codes: str = "trusted-codes"
+
         self.ip: Optional[str] = None
         self.opt_name_ip: str = "ip"
 
@@ -184,6 +187,20 @@ class Options:
     def __str__(self):
         return str(vars(self))
 
+    # Options read from the command line as they are, if supplied. The CLI destinations match the attribute names
+    SCALAR_ARGS = ("url", "quiet", "noninteractive", "verbose", "output", "output_format", "threads",
+                   "plugin_threads", "sleep", "location", "recursion", "plugin_recursion", "method", "data", "cookie",
+                   "stop_error", "hr", "sr", "filter", "hard_filter", "auto_filter", "dump_config", "dry_run",
+                   "limit_requests", "ip", "request_timeout", "domain_scope", "iterator", "version", "cache_dir")
+    # Options that may be supplied multiple times, as pairs of CLI destination and attribute name. They are added to
+    # the values of the config file
+    APPENDED_LIST_ARGS = (("wordlist", "wordlist_list"), ("proxy", "proxy_list"), ("header", "header_list"),
+                          ("hc", "hc_list"), ("hw", "hw_list"), ("hl", "hl_list"), ("hs", "hs_list"),
+                          ("sc", "sc_list"), ("trusted_codes", "trusted_codes_list"))
+    # Same as above, but they replace the values of the config file
+    REPLACED_LIST_ARGS = (("sw", "sw_list"), ("sl", "sl_list"), ("ss", "ss_list"), ("plugins", "plugins_list"),
+                          ("ext", "extensions"))
+
     def read_args(self, parsed_args: argparse.Namespace, console: rich.console.Console) -> None:
         """Checks all options for their validity, parses and assigns them."""
 
@@ -191,28 +208,25 @@ class Options:
             self.config = parsed_args.config
             self.import_config()
 
-        if parsed_args.url:
-            self.url = parsed_args.url
+        for arg_name in self.SCALAR_ARGS:
+            value = getattr(parsed_args, arg_name)
+            if value:
+                setattr(self, arg_name, value)
+
+        for arg_name, attribute_name in self.APPENDED_LIST_ARGS:
+            value = getattr(parsed_args, arg_name)
+            if value:
+                setattr(self, attribute_name, getattr(self, attribute_name) + flatten_list(value))
 
-        if parsed_args.wordlist:
-            self.wordlist_list = self.wordlist_list + flatten_list(parsed_args.wordlist)
+        for arg_name, attribute_name in self.REPLACED_LIST_ARGS:
+            value = getattr(parsed_args, arg_name)
+            if value:
+                setattr(self, attribute_name, flatten_list(value))
 
         if parsed_args.colorless:
             self.colorless = parsed_args.colorless
             console.no_color = True
 
-        if parsed_args.quiet:
-            self.quiet = parsed_args.quiet
-
-        if parsed_args.noninteractive:
-            self.noninteractive = parsed_args.noninteractive
-
-        if parsed_args.verbose:
-            self.verbose = parsed_args.verbose
-
-        if parsed_args.output:
-            self.output = parsed_args.output
-
         if parsed_args.debug_log:
             logger = logging.getLogger("debug_log")
             logger.propagate = False
@@ -225,111 +239,6 @@ class Options:
             logger.addHandler(handler)
         self.debug_log = parsed_args.debug_log
 
-        if parsed_args.proxy:
-            self.proxy_list = self.proxy_list + flatten_list(parsed_args.proxy)
-
-        if parsed_args.threads:
-            self.threads = parsed_args.threads
-
-        if parsed_args.plugin_threads:
-            self.plugin_threads = parsed_args.plugin_threads
-
-        if parsed_args.sleep:
-            self.sleep = parsed_args.sleep
-
-        if parsed_args.location:
-            self.location = parsed_args.location
-
-        if parsed_args.recursion:
-            self.recursion = parsed_args.recursion
-
-        if parsed_args.plugin_recursion:
-            self.plugin_recursion = parsed_args.plugin_recursion
-
-        if parsed_args.method:
-            self.method = parsed_args.method
-
-        if parsed_args.data:
-            self.data = parsed_args.data
-
-        if parsed_args.header:
-            self.header_list = self.header_list + flatten_list(parsed_args.header)
-
-        if parsed_args.cookie:
-            self.cookie = parsed_args.cookie
-
-        if parsed_args.stop_error:
-            self.stop_error = parsed_args.stop_error
-
-        if parsed_args.hc:
-            self.hc_list = self.hc_list + flatten_list(parsed_args.hc)
-
-        if parsed_args.hw:
-            self.hw_list = self.hw_list + flatten_list(parsed_args.hw)
-
-        if parsed_args.hl:
-            self.hl_list = self.hl_list + flatten_list(parsed_args.hl)
-
-        if parsed_args.hs:
-            self.hs_list = self.hs_list + flatten_list(parsed_args.hs)
-
-        if parsed_args.hr:
-            self.hr = parsed_args.hr
-
-        if parsed_args.sc:
-            self.sc_list = self.sc_list + flatten_list(parsed_args.sc)
-
-        if parsed_args.sw:
-            self.sw_list = flatten_list(parsed_args.sw)
-
-        if parsed_args.sl:
-            self.sl_list = flatten_list(parsed_args.sl)
-
-        if parsed_args.ss:
-            self.ss_list = flatten_list(parsed_args.ss)
-
-        if parsed_args.sr:
-            self.sr = parsed_args.sr
-
-        if parsed_args.filter:
-            self.filter = parsed_args.filter
-
-        if parsed_args.hard_filter:
-            self.hard_filter = parsed_args.hard_filter
-
-        if parsed_args.auto_filter:
-            self.auto_filter = parsed_args.auto_filter
-
-        if parsed_args.dump_config:
-            self.dump_config = parsed_args.dump_config
-
-        if parsed_args.dry_run:
-            self.dry_run = parsed_args.dry_run
-
-        if parsed_args.limit_requests:
-            self.limit_requests = parsed_args.limit_requests
-
-        if parsed_args.ip:
-            self.ip = parsed_args.ip
-
-        if parsed_args.request_timeout:
-            self.request_timeout = parsed_args.request_timeout
-
-        if parsed_args.domain_scope:
-            self.domain_scope = parsed_args.domain_scope
-
-        if parsed_args.plugins:
-            self.plugins_list = flatten_list(parsed_args.plugins)
-
-        if parsed_args.iterator:
-            self.iterator = parsed_args.iterator
-
-        if parsed_args.cache_dir:
-            self.cache_dir = parsed_args.cache_dir
-
-        if parsed_args.ext:
-            self.extensions = flatten_list(parsed_args.ext)
-
     def get_all_opts(self) -> list[tuple]:
         """
         Returns all option parameters in a list of tuples,
@@ -374,6 +283,7 @@ class Options:
             (self.opt_name_hard_filter, self.hard_filter),
             (self.opt_name_dry_run, self.dry_run),
             (self.opt_name_limit_requests, self.limit_requests),
+            (self.opt_name_trusted_codes, self.trusted_codes_list),
             (self.opt_name_ip, self.ip),
             (self.opt_name_request_timeout, self.request_timeout),
             (self.opt_name_domain_scope, self.domain_scope),
@@ -421,7 +331,9 @@ class Options:
         """
         try:
             with open(self.config, "rb") as file:
-                toml_dict: TOMLDocument = load(file)
+                # A shallow copy into a plain dict keeps the typed tomlkit items for the checks, while membership
+                # tests and pops do not have to go through the document's container
+                toml_dict: dict = dict(load(file))
         except OSError:
             raise FuzzExceptBadFile(f"Config {self.config} can not be opened.")
         except ParseError as e:
@@ -536,6 +448,9 @@ class Options:
         if self.opt_name_limit_requests in toml_dict:
             self.limit_requests = self.pop_toml_int(toml_dict, self.opt_name_limit_requests)
 
+        if self.opt_name_trusted_codes in toml_dict:
+            self.trusted_codes_list += self.pop_toml_list_int(toml_dict, self.opt_name_trusted_codes)
+
         if self.opt_name_request_timeout in toml_dict:
             self.request_timeout = self.pop_toml_int(toml_dict, self.opt_name_request_timeout)
 
@@ -562,14 +477,12 @@ class Options:
 
         # If any keys are left
         if toml_dict:
-            unknown_keys = []
-            for key in toml_dict:
-                unknown_keys.append(key)
+            unknown_keys = list(toml_dict)
             raise FuzzExceptBadOptions(f"Unknown keys {unknown_keys} were supplied in the config file. "
                                        f"Please check for typos.")
 
     @staticmethod
-    def pop_toml_list_str(toml_dict: TOMLDocument, toml_key: str) -> list[str]:
+    def pop_toml_list_str(toml_dict: dict, toml_key: str) -> list[str]:
         """
         Throws an exception if the type of the toml key is not a list of strings. Pops value from dict if it is.
         Converts the type to pure Python classes.
@@ -585,7 +498,7 @@ class Options:
         return string_list
 
     @staticmethod
-    def pop_toml_list_int(toml_dict: TOMLDocument, toml_key: str) -> list[int]:
+    def pop_toml_list_int(toml_dict: dict, toml_key: str) -> list[int]:
         """
         Throws an exception if the type of the toml key is not a list of strings. Pops value from dict if it is.
         """
@@ -600,7 +513,7 @@ class Options:
         return integer_list
 
     @staticmethod
-    def pop_toml_bool(toml_dict: TOMLDocument, toml_key: str) -> bool:
+    def pop_toml_bool(toml_dict: dict, toml_key: str) -> bool:
         """
         Throws an exception if the type of the toml key is not a bool. Pops value from dict if it is.
         """
@@ -610,7 +523,7 @@ class Options:
         return boolean
 
     @staticmethod
-    def pop_toml_string(toml_dict: TOMLDocument, toml_key: str) -> str:
+    def pop_toml_string(toml_dict: dict, toml_key: str) -> str:
         """
         Throws an exception if the type of the toml key is not a string. Pops value from dict if it is.
         """
@@ -622,7 +535,7 @@ class Options:
         return standard_string
 
     @staticmethod
-    def pop_toml_int(toml_dict: TOMLDocument, toml_key: str) -> int:
+    def pop_toml_int(toml_dict: dict, toml_key: str) -> int:
         """
         Throws an exception if the type of the toml key is not an int. Pops value from dict if it is.
         """
@@ -674,21 +587,26 @@ class Options:
 
         for wordlist in self.wordlist_list:
             try:
-                open(wordlist, "r")
+                with open(wordlist, "r"):
+                    pass
             except OSError:
                 raise FuzzExceptBadFile(f"Wordlist {wordlist} can not be opened. Please ensure it "
                                         f"exists and the permissions are correct.")
 
         if self.output:
             try:
-                open(self.output, "w")
+                # Only checking accessibility. Appending does not wipe previous results, e.g. if the run only
+                # dumps the config. The printers truncate the file when they open it for the run
+                with open(self.output, "a"):
+                    pass
             except OSError:
                 raise FuzzExceptBadFile(f"Output file {self.output} can not be opened. Please ensure it is a valid path"
                                         f"with valid permissions.")
 
         if self.debug_log:
             try:
-                open(self.debug_log, "a")
+                with open(self.debug_log, "a"):
+                    pass
             except OSError:
                 raise FuzzExceptBadFile(f"Debug file {self.debug_log} can not be opened. "
                                         f"Please ensure it is a valid path with valid permissions.")
@@ -922,6 +840,11 @@ class Options:
         response_proessing_group.add_argument(f"--{self.opt_name_limit_requests}", type=int,
                                               help="Limit recursions. Once specified amount of requests are sent, "
                                                    "recursions will be deactivated")
+        response_proessing_group.add_argument(f"--{self.opt_name_trusted_codes}", action="append",
+                                              help="Trust recursion candidates responding with the supplied codes "
+                                                   "instead of sending requests to check whether they are false "
+                                                   f"positives (e.g. --{self.opt_name_trusted_codes} 401 403).",
+                                              nargs="*", type=int)
         response_proessing_group.add_argument(f"--{self.opt_name_request_timeout}", type=int,
                                               help="Change the maximum seconds the request is allowed to take. "
                                                    f"(default: {default_request_timeout})")
@@ -40,8 +40,7 @@ class File:
         """Counts the amount of lines in the file"""
 
         if self.__count is None:
-            self.__count = len(list(self.f))
-            self.f.reset()
+            self.__count = self.f.count_lines()
 
         return self.__count
 
@@ -1,5 +1,12 @@
 import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from rich.console import Console
+
 from wenum.user_opts import Options
+from wenum.runtime_session import FuzzSession
+from wenum.fuzzqueues import RecursiveQueue, PluginExecutor
 import logging
 import os
 from tomlkit import load
@@ -487,6 +494,99 @@ doesnt_exist = true
             options.import_config()
         self.assertTrue("is not an int" in str(exc.exception), msg=str(exc.exception))
 
+    def test_read_args(self):
+        self.longMessage = True
+        options = Options()
+        parser = options.configure_parser()
+
+        # Scalar options
+        parsed_args = parser.parse_args(
+            [f"--{options.opt_name_url}", "http://example.com", f"--{options.opt_name_wordlist}",
+             "dummy_wordlist.txt", "-f", "json", "-V", f"--{options.opt_name_threads}", "12"])
+        options.read_args(parsed_args, Console())
+        self.assertEqual("json", options.output_format)
+        self.assertTrue(options.version)
+        self.assertEqual(12, options.threads)
+
+        # Appended list options accumulate across flags, replaced list options take the last values
+        with open("dummy_config.toml", "w") as file:
+            file.write(f"""
+{options.opt_name_url} = "http://example.com/FUZZ"
+{options.opt_name_wordlist} = ["dummy_wordlist.txt"]
+{options.opt_name_hc} = [404]
+{options.opt_name_header} = ["Config: header"]
+{options.opt_name_sw} = [10]
+{options.opt_name_plugins} = ["default"]
+""")
+        options = Options()
+        parsed_args = parser.parse_args(
+            [f"--{options.opt_name_config}", "dummy_config.toml", f"--{options.opt_name_hc}", "200", "403",
+             f"--{options.opt_name_hc}", "302", f"--{options.opt_name_header}", "Test: asd",
+             f"--{options.opt_name_sw}", "20", f"--{options.opt_name_plugins}", "robots", "headers"])
+        options.read_args(parsed_args, Console())
+        self.assertEqual([404, 200, 403, 302], options.hc_list)
+        self.assertEqual(["Config: header", "Test: asd"], options.header_list)
+        self.assertEqual([20], options.sw_list)
+        self.assertEqual(["robots", "headers"], options.plugins_list)
+        self.assertEqual(["dummy_wordlist.txt"], options.wordlist_list)
+
+    def test_trusted_codes(self):
+        self.longMessage = True
+        options = Options()
+        parser = options.configure_parser()
+
+        parsed_args = parser.parse_args(
+            [f"--{options.opt_name_url}", "http://example.com", f"--{options.opt_name_wordlist}",
+             "dummy_wordlist.txt", f"--{options.opt_name_trusted_codes}", "401", "403",
+             f"--{options.opt_name_trusted_codes}", "500"])
+        options.read_args(parsed_args, Console())
+        self.assertEqual([401, 403, 500], options.trusted_codes_list)
+        self.assertIn((options.opt_name_trusted_codes, [401, 403, 500]), options.get_all_opts())
+
+        # Config values are extended by the command line values
+        with open("dummy_config.toml", "w") as file:
+            file.write(f"""
+{options.opt_name_url} = "http://example.com/FUZZ"
+{options.opt_name_wordlist} = ["dummy_wordlist.txt"]
+{options.opt_name_trusted_codes} = [302]
+""")
+        options = Options()
+        parsed_args = parser.parse_args(
+            [f"--{options.opt_name_config}", "dummy_config.toml", f"--{options.opt_name_trusted_codes}", "401"])
+        options.read_args(parsed_args, Console())
+        self.assertEqual([302, 401], options.trusted_codes_list)
+
+        # Dumped config imports to the same codes
+        options.dump_config = "dummy_config_dump.toml"
+        options.export_config()
+        with open(options.dump_config, "rb") as file:
+            self.assertEqual([302, 401], load(file)[options.opt_name_trusted_codes])
+        imported_options = Options()
+        imported_options.config = options.dump_config
+        imported_options.import_config()
+        self.assertEqual([302, 401], imported_options.trusted_codes_list)
+
+    def test_trusted_codes_skip_false_positive_check(self):
+        self.longMessage = True
+        options = Options()
+        parser = options.configure_parser()
+
+        parsed_args = parser.parse_args(
+            [f"--{options.opt_name_url}", "http://example.com/FUZZ", f"--{options.opt_name_wordlist}",
+             "dummy_wordlist.txt", f"--{options.opt_name_trusted_codes}", "401", f"--{options.opt_name_quiet}",
+             f"--{options.opt_name_noninteractive}"])
+        options.read_args(parsed_args, Console())
+        session = FuzzSession(options, Console()).compile()
+
+        for queue in (RecursiveQueue(session), PluginExecutor(session, [])):
+            with mock.patch.object(RecursiveQueue, "false_positive_hit", return_value=True) as false_positive_hit:
+                self.assertFalse(queue.is_false_positive(SimpleNamespace(code=401)), msg=queue.get_name())
+                false_positive_hit.assert_not_called()
+
+                self.assertTrue(queue.is_false_positive(SimpleNamespace(code=200)), msg=queue.get_name())
+                false_positive_hit.assert_called_once()
+            queue.cleanup()
+
     def _invalid_path(self, options):
         with self.assertRaises(Exception) as exc:
             options.basic_validate()